@@ -7,6 +7,12 @@ class Settings:
 
     #database
     DATABASE_PATH = os.getenv('DATABASE_PATH', 'data/jobs.db')
+    DB_BUSY_TIMEOUT = float(os.getenv('DB_BUSY_TIMEOUT', '30'))
+
+    #Read snapshots served by the API
+    SNAPSHOT_DIR = os.getenv('SNAPSHOT_DIR', 'data/snapshots')
+    SNAPSHOT_KEEP = int(os.getenv('SNAPSHOT_KEEP', '3'))
+    SNAPSHOT_MMAP_SIZE = int(os.getenv('SNAPSHOT_MMAP_SIZE', str(256 * 1024 * 1024)))
 
     #API KEYS
     ADZUNA_APP_ID = os.getenv('ADZUNA_APP_ID', '')
@@ -21,16 +27,44 @@ class Settings:
     SMTP_PASSWORD = os.getenv('SMTP_PASSWORD', '')
     
     DISCORD_WEBHOOK = os.getenv('DISCORD_WEBHOOK', '')
+    # Seconds before long-running workers reload saved searches
+    ALERTS_REFRESH_INTERVAL = float(os.getenv('ALERTS_REFRESH_INTERVAL', '60'))
 
     #Scrapping
     REQUEST_TIMEOUT = 10 
     RATE_LIMIT_DELAY = 1
     MAX_RETRIES = 3
+    SCRAPE_PAGES = int(os.getenv('SCRAPE_PAGES', '1'))
+
+    #Task queue
+    QUEUE_BACKEND = os.getenv('QUEUE_BACKEND', 'sqlite')
+    QUEUE_LEASE_SECONDS = int(os.getenv('QUEUE_LEASE_SECONDS', '120'))
+    QUEUE_POLL_INTERVAL = float(os.getenv('QUEUE_POLL_INTERVAL', '2'))
+
+    #HTML scraping
+    BROWSER_POOL_SIZE = int(os.getenv('BROWSER_POOL_SIZE', '4'))
+    BLOCKED_RESOURCE_TYPES = ["image", "font", "media"]
+    BLOCKED_DOMAINS = [
+        "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+        "facebook.net", "hotjar.com", "segment.io", "newrelic.com"
+    ]
 
     #FILTERS
     KEYWORDS = ["python","java","api","backend"]
     EXPERIENCE_LEVEL = "junior"
     LOCATIONS = ["remote", "texas","newyork"]
 
+    #Relevance ranking (see src/services/scoring.py)
+    SCORING_WEIGHTS = {
+        "title_keywords": 3.0,
+        "description_keywords": 1.0,
+        "seniority": 2.0,
+        "salary": 1.0,
+        "location": 2.0,
+        "recency": 2.0,
+    }
+    SCORING_SALARY_REFERENCE = 100000
+    SCORING_RECENCY_HALF_LIFE_DAYS = 7
+
 settings = Settings()
 
@@ -0,0 +1,114 @@
+# scripts/bench_alerts.py
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import random
+import time
+from src.services.alerts import SavedSearchMatcher
+from src.utils.text import tokenize
+
+SKILLS = [
+    "python", "java", "golang", "rust", "c++", "c#", "javascript", "typescript",
+    "react", "django", "flask", "fastapi", "spring", "kubernetes", "docker", "aws",
+    "gcp", "azure", "terraform", "sql", "postgres", "kafka", "spark", "airflow",
+    "machine learning", "data engineer", "backend", "frontend", "devops", "api",
+    "graphql", "redis", "linux", "security", "mobile", "ios", "android", "scala"
+]
+LOCATIONS = [
+    "remote", "texas", "new york", "california", "seattle", "austin", "boston",
+    "chicago", "denver", "atlanta", "london", "toronto"
+]
+LEVELS = [None, None, "junior", "senior", "lead"]
+FILLER = (
+    "we are hiring a team member to build and operate services with strong "
+    "ownership communication testing and collaboration across product teams"
+).split()
+
+def make_searches(count, rng):
+    searches = []
+    for i in range(count):
+        searches.append({
+            'id': i,
+            'user': f"user{i % 500}",
+            'keywords': rng.sample(SKILLS, rng.randint(1, 3)) if rng.random() < 0.97 else [],
+            'locations': rng.sample(LOCATIONS, rng.randint(0, 2)),
+            'salary_min': rng.choice([None, 60000, 90000, 120000]),
+            'experience_level': rng.choice(LEVELS),
+            'channels': ['email'],
+        })
+    return searches
+
+def make_jobs(count, rng):
+    jobs = []
+    for _ in range(count):
+        skills = rng.sample(SKILLS, 3)
+        level = rng.choice(["Junior", "Senior", "Lead", ""])
+        words = rng.choices(FILLER, k=120) + skills
+        rng.shuffle(words)
+        jobs.append({
+            'title': f"{level} {skills[0]} Developer".strip(),
+            'company': "Acme",
+            'location': rng.choice(LOCATIONS).title(),
+            'description': ' '.join(words),
+            'salary_min': rng.choice([None, 70000]),
+            'salary_max': rng.choice([None, 100000, 150000]),
+        })
+    return jobs
+
+def naive_match(searches, job):
+    """Reference implementation: check every search against every job"""
+    text = set(tokenize(job['title'])) | set(tokenize(job['company'])) | set(tokenize(job['description']))
+    title = set(tokenize(job['title']))
+    location = set(tokenize(job['location']))
+    salary = job.get('salary_max') or job.get('salary_min')
+    matches = []
+
+    for search in searches:
+        if search['keywords'] and not any(text.issuperset(tokenize(k)) for k in search['keywords']):
+            continue
+        if search['locations'] and not any(location.issuperset(tokenize(l)) for l in search['locations']):
+            continue
+        if search['salary_min'] and salary and salary < search['salary_min']:
+            continue
+        if search['experience_level'] and not title.issuperset(tokenize(search['experience_level'])):
+            continue
+        matches.append(search)
+    return matches
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark saved-search matching')
+    parser.add_argument('--searches', type=int, default=10000, help='Number of saved searches')
+    parser.add_argument('--jobs', type=int, default=1000, help='Number of jobs to match')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    searches = make_searches(args.searches, rng)
+    jobs = make_jobs(args.jobs, rng)
+
+    start = time.perf_counter()
+    matcher = SavedSearchMatcher(searches)
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    indexed = [matcher.match(job) for job in jobs]
+    indexed_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    naive = [naive_match(searches, job) for job in jobs]
+    naive_s = time.perf_counter() - start
+
+    for got, expected in zip(indexed, naive):
+        assert sorted(s['id'] for s in got) == sorted(s['id'] for s in expected), "matcher disagrees with naive scan"
+
+    total_matches = sum(len(m) for m in indexed)
+    print(f"Searches: {args.searches}  Jobs: {args.jobs}  Matches: {total_matches}")
+    print(f"Compile:       {compile_ms:8.1f} ms")
+    print(f"Indexed match: {indexed_s / args.jobs * 1e6:8.1f} us/job")
+    print(f"Naive scan:    {naive_s / args.jobs * 1e6:8.1f} us/job")
+    print(f"Speedup:       {naive_s / indexed_s:8.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+# scripts/bench_html.py
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import tempfile
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from bs4 import BeautifulSoup
+
+from src.fetchers.html import PARSER, CareerPageFetcher
+
+SELECTORS = {
+    'job': 'li.opening',
+    'title': 'h3',
+    'location': '.location',
+    'description': '.summary',
+    'link': 'a',
+    'id': 'data-job-id',
+}
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+def write_pages(directory, pages, jobs_per_page):
+    for page in range(1, pages + 1):
+        items = ''.join(
+            f'''<li class="opening" data-job-id="{page}-{i}">
+                  <h3>Engineer {page}-{i}</h3><span class="location">Remote</span>
+                  <p class="summary">Build services in Python and Go. {'Details. ' * 20}</p>
+                  <a href="/jobs/{page}/{i}">Apply</a>
+                </li>'''
+            for i in range(jobs_per_page)
+        )
+        html = f'''<!DOCTYPE html><html><head><title>Careers {page}</title>
+            <script async src="https://www.google-analytics.com/analytics.js"></script></head>
+            <body><img src="/logo.png"><ul class="openings">{items}</ul></body></html>'''
+        with open(os.path.join(directory, f"careers_{page}.html"), 'w', encoding='utf-8') as f:
+            f.write(html)
+
+def make_fetcher(base_url, pages, **kwargs):
+    return CareerPageFetcher('bench', base_url + '/careers_{page}.html', SELECTORS, pages=pages, **kwargs)
+
+def naive(base_url, pages):
+    """New connection and the html.parser backend for every page"""
+    fetcher = make_fetcher(base_url, pages)
+    jobs = []
+    for page in range(1, pages + 1):
+        url = f"{base_url}/careers_{page}.html"
+        soup = BeautifulSoup(requests.get(url, timeout=10).text, 'html.parser')
+        jobs.extend(fetcher.parse_jobs(soup, url))
+    return jobs
+
+def all_pages(base_url, pages, **kwargs):
+    with make_fetcher(base_url, pages, **kwargs) as fetcher:
+        return fetcher.fetch_all_pages('python')
+
+def page_per_call(base_url, pages, **kwargs):
+    """How queue workers call it: one page per task on a long-lived fetcher"""
+    with make_fetcher(base_url, pages, **kwargs) as fetcher:
+        jobs = []
+        for page in range(1, pages + 1):
+            jobs.extend(fetcher.fetch_jobs('python', page=page))
+        return jobs
+
+def browser_per_page(base_url, pages):
+    """What the pool avoids: a fresh browser launch for every page"""
+    jobs = []
+    for page in range(1, pages + 1):
+        with make_fetcher(base_url, pages, requires_js=True) as fetcher:
+            jobs.extend(fetcher.fetch_jobs('python', page=page))
+    return jobs
+
+def browser_available(base_url):
+    fetcher = make_fetcher(base_url, 1, requires_js=True)
+    try:
+        fetcher._run(fetcher._get_pool())
+        return True
+    except Exception as e:
+        print(f"(skipping browser rows: {str(e).splitlines()[0]})")
+        return False
+    finally:
+        fetcher.close()
+
+def measure(label, fn, expected_jobs):
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    jobs = fn()
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    if len(jobs) != expected_jobs:
+        raise RuntimeError(f"{label}: parsed {len(jobs)} jobs, expected {expected_jobs}")
+    return wall, cpu
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark HTML career-page fetching (pages/sec)')
+    parser.add_argument('--pages', type=int, default=200, help='Static pages to fetch')
+    parser.add_argument('--browser-pages', type=int, default=20, help='Pages for the browser rows')
+    parser.add_argument('--jobs-per-page', type=int, default=25, help='Listings per page')
+    parser.add_argument('--concurrency', type=int, default=4, help='Concurrent pages')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_pages(tmp, max(args.pages, args.browser_pages), args.jobs_per_page)
+        httpd = ThreadingHTTPServer(('127.0.0.1', 0), partial(QuietHandler, directory=tmp))
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{httpd.server_address[1]}"
+
+        rows = [
+            ('naive (html.parser, new conn)', args.pages, lambda: naive(base_url, args.pages)),
+            (f'fetch_all_pages ({PARSER})', args.pages,
+             lambda: all_pages(base_url, args.pages, concurrency=args.concurrency)),
+            (f'fetch_jobs per page ({PARSER})', args.pages,
+             lambda: page_per_call(base_url, args.pages)),
+        ]
+        if browser_available(base_url):
+            rows += [
+                ('browser pool, page per call', args.browser_pages,
+                 lambda: page_per_call(base_url, args.browser_pages, requires_js=True,
+                                       concurrency=args.concurrency)),
+                ('browser pool, fetch_all_pages', args.browser_pages,
+                 lambda: all_pages(base_url, args.browser_pages, requires_js=True,
+                                   concurrency=args.concurrency)),
+                ('browser launch per page', args.browser_pages,
+                 lambda: browser_per_page(base_url, args.browser_pages)),
+            ]
+
+        print(f"{'mode':34} {'pages':>6} {'pages/s':>9} {'pages/cpu-s':>12}")
+        print("-" * 64)
+        for label, pages, fn in rows:
+            wall, cpu = measure(label, fn, pages * args.jobs_per_page)
+            print(f"{label:34} {pages:>6} {pages / wall:>9.1f} {pages / max(cpu, 1e-9):>12.1f}")
+
+        httpd.shutdown()
+        httpd.server_close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+# scripts/bench_queue.py
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import multiprocessing
+import tempfile
+import time
+import requests
+from src.fetchers.base import BaseFetcher
+from src.models.database import Database
+from src.services.task_queue import SQLiteTaskQueue, enqueue_run
+from src.services.worker import Worker, register_fetcher
+
+class FakeFetcher(BaseFetcher):
+    """
+    Stands in for a network fetcher: fixed latency, deterministic jobs
+
+    Pages in flaky fail their first fetch with a connection error, like the
+    real fetchers: logged and [] unless raise_errors is set. A marker file
+    per page makes the failure happen once across worker processes.
+    """
+
+    def __init__(self, latency, jobs_per_task, flaky=(), marker_dir=None):
+        super().__init__('bench')
+        self.latency = latency
+        self.jobs_per_task = jobs_per_task
+        self.flaky = set(flaky)
+        self.marker_dir = marker_dir
+
+    def _fail_once(self, key):
+        if key not in self.flaky:
+            return False
+        try:
+            os.close(os.open(os.path.join(self.marker_dir, key), os.O_CREAT | os.O_EXCL))
+            return True
+        except FileExistsError:
+            return False
+
+    def fetch_jobs(self, keyword, location=None, page=1, raise_errors=False):
+        time.sleep(self.latency)
+        if self._fail_once(f"{keyword}-{page}"):
+            if raise_errors:
+                raise requests.ConnectionError(f"simulated outage for {keyword} page {page}")
+            return []
+        return [
+            {
+                'external_id': f"{keyword}-{page}-{i}",
+                'title': f"Engineer {keyword} {page} {i}",
+                'company': 'Bench Corp',
+                'location': 'Remote',
+                'description': 'benchmark job',
+                'url': f"https://example.com/{keyword}/{page}/{i}",
+            }
+            for i in range(self.jobs_per_task)
+        ]
+
+def run_worker(db_path, worker_id, latency, jobs_per_task, lease_seconds, flaky, marker_dir, results):
+    register_fetcher('bench', lambda: FakeFetcher(latency, jobs_per_task, flaky, marker_dir), 'https://example.com')
+    db = Database(db_path)
+    queue = SQLiteTaskQueue(db, lease_seconds=lease_seconds)
+    worker = Worker(queue, db, worker_id=worker_id, poll_interval=0.1)
+    results[worker_id] = worker.run()
+
+def bench(workers, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'jobs.db')
+        db = Database(db_path)
+        # One non-matching saved search routes new jobs to alerts instead of
+        # trying to email every one of them
+        db.insert_saved_search('bench', keywords=['no-such-keyword-anywhere'])
+
+        queue = SQLiteTaskQueue(db, lease_seconds=args.lease)
+        keywords = [f"kw{i}" for i in range(args.tasks // args.pages)]
+        run_id, added = enqueue_run(queue, ['bench'], keywords, pages=args.pages)
+
+        # Simulate workers that died holding a lease
+        for i in range(args.crashed):
+            queue.claim(f"crashed-{i}")
+
+        # ...and pages whose first fetch hits a network error
+        flaky = [f"{keywords[i % len(keywords)]}-{i // len(keywords) + 1}" for i in range(args.flaky)]
+        marker_dir = os.path.join(tmp, 'flaky')
+        os.makedirs(marker_dir)
+
+        ctx = multiprocessing.get_context('spawn')
+        results = ctx.Manager().dict()
+        processes = [
+            ctx.Process(
+                target=run_worker,
+                args=(db_path, f"w{i}", args.latency, args.jobs_per_task, args.lease, flaky, marker_dir, results)
+            )
+            for i in range(workers)
+        ]
+
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+        with db.get_connection() as conn:
+            statuses = dict(conn.execute('SELECT status, COUNT(*) FROM tasks GROUP BY status').fetchall())
+            jobs = conn.execute('SELECT COUNT(*), COUNT(DISTINCT external_id) FROM jobs').fetchone()
+            retried = conn.execute('SELECT COUNT(*) FROM tasks WHERE attempts > 1').fetchone()[0]
+            attempts = dict(conn.execute("SELECT keyword || '-' || page, attempts FROM tasks").fetchall())
+
+        completed = sum(results.values())
+        expected_jobs = added * args.jobs_per_task
+        problems = []
+        if statuses.get('done', 0) != added:
+            problems.append(f"tasks not done: {statuses}")
+        if completed != added:
+            problems.append(f"workers completed {completed} tasks, expected {added}")
+        if jobs[0] != expected_jobs or jobs[1] != expected_jobs:
+            problems.append(f"jobs stored {jobs[0]} ({jobs[1]} distinct), expected {expected_jobs}")
+        not_retried = [key for key in flaky if attempts[key] < 2]
+        if not_retried:
+            problems.append(f"failed fetches were not retried: {', '.join(not_retried)}")
+
+        return added, elapsed, retried, problems
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the scrape task queue with local workers')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help='Worker counts to try')
+    parser.add_argument('--tasks', type=int, default=160, help='Tasks per run')
+    parser.add_argument('--pages', type=int, default=4, help='Pages per keyword')
+    parser.add_argument('--latency', type=float, default=0.05, help='Simulated fetch latency (s)')
+    parser.add_argument('--jobs-per-task', type=int, default=20, help='Jobs returned per task')
+    parser.add_argument('--lease', type=int, default=2, help='Lease seconds')
+    parser.add_argument('--crashed', type=int, default=2, help='Tasks abandoned by a dead worker')
+    parser.add_argument('--flaky', type=int, default=4, help='Tasks whose first fetch fails')
+    args = parser.parse_args()
+
+    baseline = None
+    failed = False
+    print(f"{'workers':>7} {'tasks':>6} {'seconds':>8} {'tasks/s':>8} {'speedup':>8} {'retried':>8}")
+
+    for workers in args.workers:
+        tasks, elapsed, retried, problems = bench(workers, args)
+        throughput = tasks / elapsed
+        baseline = baseline or throughput
+        print(f"{workers:>7} {tasks:>6} {elapsed:>8.2f} {throughput:>8.1f} {throughput / baseline:>7.2f}x {retried:>8}")
+        for problem in problems:
+            failed = True
+            print(f"   FAIL {problem}")
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
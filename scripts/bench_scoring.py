@@ -0,0 +1,109 @@
+# scripts/bench_scoring.py
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import math
+import random
+import statistics
+import struct
+import tempfile
+import time
+from datetime import datetime, timezone
+from config.settings import settings
+from src.models.database import Database
+from src.services.scoring import FEATURE_FORMAT, FEATURE_SIZE, rank_jobs, score_features
+
+TITLES = ["Python Developer", "Java Engineer", "Backend API Engineer", "Data Analyst", "Frontend Developer"]
+PLACES = ["Remote", "Austin, Texas", "New York, NY", "Denver, CO", "Seattle, WA"]
+
+def populate(db, count, rng):
+    today = datetime.now(timezone.utc).timestamp() / 86400
+    jobs = []
+    features = []
+    for i in range(1, count + 1):
+        salary = rng.choice([math.nan, rng.uniform(40000, 200000)])
+        jobs.append((
+            1, str(i), rng.choice(TITLES), f"Company {i % 997}", rng.choice(PLACES),
+            "synthetic job", f"https://example.com/{i}"
+        ))
+        features.append((i, struct.pack(
+            FEATURE_FORMAT,
+            rng.randint(0, 2), rng.randint(0, 6), rng.choice([-1, 0, 1]),
+            salary, rng.choice([0, 1]), today - rng.uniform(0, 60)
+        )))
+
+    with db.get_connection() as conn:
+        conn.execute("INSERT INTO sources (name, base_url) VALUES ('bench', 'https://example.com')")
+        conn.executemany(
+            '''INSERT INTO jobs (source_id, external_id, title, company, location, description, url)
+               VALUES (?, ?, ?, ?, ?, ?, ?)''',
+            jobs
+        )
+        conn.executemany('INSERT INTO job_features (job_id, features) VALUES (?, ?)', features)
+
+def python_loop_scores(blobs, now_day):
+    """Reference per-job Python scoring, for comparison"""
+    w = settings.SCORING_WEIGHTS
+    scores = []
+    for blob in blobs:
+        title, description, seniority, salary, location, posted_day = struct.unpack(FEATURE_FORMAT, blob)
+        salary_score = 0.0 if math.isnan(salary) else min(max(salary / settings.SCORING_SALARY_REFERENCE, 0), 2)
+        recency = 0.0 if math.isnan(posted_day) else 2 ** (-max(now_day - posted_day, 0) / settings.SCORING_RECENCY_HALF_LIFE_DAYS)
+        scores.append(
+            w['title_keywords'] * title + w['description_keywords'] * math.log1p(description)
+            + w['seniority'] * seniority + w['salary'] * salary_score
+            + w['location'] * location + w['recency'] * recency
+        )
+    return scores
+
+def timed(fn, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark relevance ranking latency')
+    parser.add_argument('--jobs', type=int, default=100000, help='Candidate jobs')
+    parser.add_argument('--limit', type=int, default=50, help='Top-k')
+    parser.add_argument('--runs', type=int, default=20, help='Timed runs')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    args = parser.parse_args()
+
+    import numpy as np
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, 'jobs.db'))
+        populate(db, args.jobs, random.Random(args.seed))
+
+        ids, packed = db.candidate_features()
+        matrix = np.frombuffer(packed, dtype='<f4').reshape(len(ids.split(',')), -1)
+        blobs = [packed[i:i + FEATURE_SIZE] for i in range(0, len(packed), FEATURE_SIZE)]
+        now_day = datetime.now(timezone.utc).timestamp() / 86400
+
+        # Same ranking either way
+        vector = score_features(matrix)
+        loop = np.array(python_loop_scores(blobs, now_day))
+        assert np.allclose(vector, loop, rtol=1e-4, atol=1e-3), "vectorized scores disagree with Python loop"
+
+        rows = [
+            ('fetch candidates', lambda: db.candidate_features()),
+            ('vectorized score', lambda: score_features(matrix)),
+            ('python loop score', lambda: python_loop_scores(blobs, now_day)),
+            (f'rank_jobs top-{args.limit}', lambda: rank_jobs(db, limit=args.limit)),
+            (f'rank_jobs keyword top-{args.limit}', lambda: rank_jobs(db, keyword='python', limit=args.limit)),
+        ]
+
+        print(f"Candidates: {len(blobs)}")
+        print("-" * 60)
+        for label, fn in rows:
+            p50, p95 = timed(fn, args.runs)
+            print(f"{label:32} p50 {p50:8.2f} ms   p95 {p95:8.2f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+# scripts/bench_startup.py
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import statistics
+import subprocess
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+CLI = os.path.join(ROOT, 'scripts', 'cli.py')
+
+# Interactive commands, with any FORBIDDEN modules they genuinely need.
+# Allowed modules are left out of the import budget.
+COMMANDS = [
+    (['--help'], []),
+    (['list', '--limit', '1'], []),
+    (['list', '--sort', 'relevance', '--limit', '1'], ['numpy']),
+    (['searches'], []),
+    (['export', '--keyword', 'no-such-job'], []),
+]
+FORBIDDEN = ['requests', 'smtplib', 'email.mime', 'fastapi', 'playwright', 'bs4', 'numpy', 'src.fetchers', 'src.services.notifier']
+
+def matches(name, prefixes):
+    return any(name == prefix or name.startswith(prefix + '.') for prefix in prefixes)
+
+def parse_importtime(stderr):
+    """Return {module: self_us} from `python -X importtime` output"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(self_us)
+    return modules
+
+def run(args, env, importtime=False):
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ['-X', 'importtime']
+    start = time.perf_counter()
+    result = subprocess.run(cmd + args, env=env, cwd=ROOT, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} failed:\n{result.stderr}")
+    return elapsed, result.stderr
+
+def main():
+    parser = argparse.ArgumentParser(description='Guard CLI startup time')
+    parser.add_argument('--runs', type=int, default=5, help='Timed runs per command')
+    parser.add_argument('--budget-ms', type=float, default=50.0,
+                        help='Max import time on top of a bare interpreter')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_PATH=os.path.join(tmp, 'jobs.db'))
+
+        # Migrate once up front so timings show steady-state startup
+        run([CLI, 'searches'], env)
+
+        _, baseline_err = run(['-c', 'pass'], env, importtime=True)
+        baseline = parse_importtime(baseline_err)
+        interpreter_s = statistics.median(run(['-c', 'pass'], env)[0] for _ in range(args.runs))
+
+        print(f"Bare interpreter: {interpreter_s * 1000:6.1f} ms")
+        print("-" * 80)
+
+        failures = []
+        for command, allowed in COMMANDS:
+            label = ' '.join(command)
+            _, stderr = run([CLI] + command, env, importtime=True)
+            modules = parse_importtime(stderr)
+            extra = {name: us for name, us in modules.items() if name not in baseline}
+            allowed_ms = sum(us for name, us in extra.items() if matches(name, allowed)) / 1000
+            import_ms = sum(extra.values()) / 1000 - allowed_ms
+            wall_s = statistics.median(run([CLI] + command, env)[0] for _ in range(args.runs))
+
+            note = f" + {allowed_ms:.1f} ms {', '.join(allowed)}" if allowed else ''
+            print(f"{label:44} imports {import_ms:6.1f} ms   wall {wall_s * 1000:6.1f} ms   ({len(extra)} modules){note}")
+
+            leaked = sorted(
+                name for name in extra
+                if matches(name, FORBIDDEN) and not matches(name, allowed)
+            )
+            if leaked:
+                failures.append(f"{label}: imports {', '.join(leaked)}")
+            if import_ms > args.budget_ms:
+                failures.append(f"{label}: {import_ms:.1f} ms of imports exceeds {args.budget_ms:.0f} ms budget")
+
+        print("-" * 80)
+        if failures:
+            for failure in failures:
+                print(f"FAIL {failure}")
+            sys.exit(1)
+        print("OK")
+
+if __name__ == '__main__':
+    main()
@@ -4,12 +4,21 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import argparse
-from src.models.database import db
-from scripts.run_scraper import main as run_scraper
+
+# Subcommands import what they need when they run, so `list` or `searches`
+# never pay for requests, smtplib or the fetchers that `scrape` pulls in.
+# Keep module-level imports light (guarded by scripts/bench_startup.py).
+from src.services.exporter import EXPORT_FORMATS
 
 def list_jobs(args):
     """List jobs"""
-    jobs = db.query_jobs(keyword=args.keyword, location=args.location, limit=args.limit)
+    from src.models.database import db
+    
+    if args.sort == 'relevance':
+        from src.services.scoring import rank_jobs
+        jobs = rank_jobs(db, keyword=args.keyword, location=args.location, limit=args.limit)
+    else:
+        jobs = db.query_jobs(keyword=args.keyword, location=args.location, limit=args.limit)
     
     if not jobs:
         print("No jobs found")
@@ -24,10 +33,14 @@ def list_jobs(args):
         print(f"Company: {job['company']}")
         print(f"Location: {job.get('location', 'N/A')}")
         print(f"URL: {job['url']}")
+        if 'score' in job:
+            print(f"Score: {job['score']}")
         print("-" * 80)
 
 def track_application(args):
     """Track job application"""
+    from src.models.database import db
+    
     job = db.get_job(args.job_id)
     
     if not job:
@@ -39,6 +52,8 @@ def track_application(args):
 
 def show_applications(args):
     """Show applications"""
+    from src.models.database import db
+    
     apps = db.get_applications(status=args.status)
     
     if not apps:
@@ -56,6 +71,129 @@ def show_applications(args):
             print(f"Notes: {app['notes']}")
         print("-" * 80)
 
+def save_search(args):
+    """Save an alert search"""
+    from src.models.database import db
+    
+    search_id = db.insert_saved_search(
+        args.user,
+        keywords=args.keyword,
+        locations=args.location,
+        salary_min=args.salary_min,
+        experience_level=args.experience,
+        channels=args.channel,
+        name=args.name
+    )
+    print(f"✓ Saved search {search_id} for {args.user}")
+
+def show_searches(args):
+    """Show saved searches"""
+    from src.models.database import db
+    
+    searches = db.get_saved_searches(user=args.user)
+    
+    if not searches:
+        print("No saved searches found")
+        return
+    
+    print(f"\nFound {len(searches)} saved searches:\n")
+    print("-" * 80)
+    
+    for search in searches:
+        print(f"ID: {search['id']} ({search['user']})")
+        if search.get('name'):
+            print(f"Name: {search['name']}")
+        print(f"Keywords: {', '.join(search['keywords']) or 'any'}")
+        print(f"Locations: {', '.join(search['locations']) or 'any'}")
+        if search.get('salary_min'):
+            print(f"Salary floor: {search['salary_min']}")
+        if search.get('experience_level'):
+            print(f"Experience: {search['experience_level']}")
+        print(f"Channels: {', '.join(search['channels'])}")
+        print("-" * 80)
+
+def export_jobs(args):
+    """Stream jobs to a file or stdout"""
+    from src.models.database import db
+    from src.services.exporter import iter_export
+    
+    batches = db.iter_job_batches(
+        keyword=args.keyword,
+        location=args.location,
+        batch_size=args.batch_size
+    )
+
+    try:
+        chunks = iter_export(batches, args.format)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    if args.output:
+        with open(args.output, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        print(f"✓ Exported jobs to {args.output}", file=sys.stderr)
+    else:
+        for chunk in chunks:
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+
+def rescore(args):
+    """Recompute relevance features for every job"""
+    from src.models.database import db
+    from src.services.scoring import compute_features
+    
+    total = db.rebuild_job_features(compute_features, batch_size=args.batch_size)
+    print(f"✓ Rescored {total} jobs")
+
+def publish(args):
+    """Publish a read snapshot for the API"""
+    from src.models.database import db
+    from src.services.snapshot import publish_snapshot
+    
+    path = publish_snapshot(db)
+    print(f"✓ Published snapshot {path}")
+
+def rollback(args):
+    """Re-publish the previous read snapshot"""
+    from src.services.snapshot import rollback_snapshot
+    
+    path = rollback_snapshot()
+    if not path:
+        print("No earlier snapshot to roll back to")
+        return
+    print(f"✓ Rolled back to {path}")
+
+def enqueue(args):
+    """Enqueue scrape tasks for workers"""
+    from config.settings import settings
+    from src.models.database import db
+    from src.services.task_queue import get_queue, enqueue_run
+    
+    run_id, added = enqueue_run(
+        get_queue(db),
+        sources=args.source or ['adzuna'],
+        keywords=args.keyword or settings.KEYWORDS,
+        location=args.location or '',
+        pages=args.pages or settings.SCRAPE_PAGES
+    )
+    print(f"✓ Enqueued {added} tasks for run {run_id}")
+
+def queue_status(args):
+    """Show task counts by status"""
+    from src.models.database import db
+    from src.services.task_queue import get_queue
+    
+    counts = get_queue(db).stats(run_id=args.run_id)
+    
+    if not counts:
+        print("No tasks found")
+        return
+    
+    for status in ('pending', 'leased', 'done', 'failed'):
+        print(f"{status:8} {counts.get(status, 0)}")
+
 def main():
     parser = argparse.ArgumentParser(description='Job Scraper CLI')
     subparsers = parser.add_subparsers(dest='command', help='Commands')
@@ -68,6 +206,7 @@ def main():
     list_parser.add_argument('--keyword', help='Filter by keyword')
     list_parser.add_argument('--location', help='Filter by location')
     list_parser.add_argument('--limit', type=int, default=20, help='Max results')
+    list_parser.add_argument('--sort', choices=['relevance'], help='Rank results')
     
     # Apply command
     apply_parser = subparsers.add_parser('apply', help='Track application')
@@ -78,9 +217,50 @@ def main():
     apps_parser = subparsers.add_parser('applications', help='Show applications')
     apps_parser.add_argument('--status', help='Filter by status')
     
+    # Save search command
+    search_parser = subparsers.add_parser('save-search', help='Save an alert search')
+    search_parser.add_argument('user', help='User the alerts belong to')
+    search_parser.add_argument('--name', help='Search name')
+    search_parser.add_argument('--keyword', action='append', help='Keyword (repeatable)')
+    search_parser.add_argument('--location', action='append', help='Location (repeatable)')
+    search_parser.add_argument('--salary-min', type=int, help='Salary floor')
+    search_parser.add_argument('--experience', help='Experience level, e.g. junior')
+    search_parser.add_argument('--channel', action='append', choices=['email', 'discord'], help='Notification channel (repeatable)')
+    
+    # Searches command
+    searches_parser = subparsers.add_parser('searches', help='Show saved searches')
+    searches_parser.add_argument('--user', help='Filter by user')
+    
+    # Export command
+    export_parser = subparsers.add_parser('export', help='Export jobs')
+    export_parser.add_argument('--format', choices=EXPORT_FORMATS, default='ndjson', help='Output format')
+    export_parser.add_argument('--output', '-o', help='Output file (default: stdout)')
+    export_parser.add_argument('--keyword', help='Filter by keyword')
+    export_parser.add_argument('--location', help='Filter by location')
+    export_parser.add_argument('--batch-size', type=int, default=1000, help='Rows fetched per batch')
+    
+    # Rescore command
+    rescore_parser = subparsers.add_parser('rescore', help='Recompute relevance features')
+    rescore_parser.add_argument('--batch-size', type=int, default=1000, help='Jobs per batch')
+    
+    # Queue commands
+    enqueue_parser = subparsers.add_parser('enqueue', help='Enqueue scrape tasks for workers')
+    enqueue_parser.add_argument('--source', action='append', help='Source (repeatable, default: adzuna)')
+    enqueue_parser.add_argument('--keyword', action='append', help='Keyword (repeatable, default: settings.KEYWORDS)')
+    enqueue_parser.add_argument('--location', help='Source location, e.g. us')
+    enqueue_parser.add_argument('--pages', type=int, help='Pages per keyword')
+    
+    queue_parser = subparsers.add_parser('queue', help='Show task queue status')
+    queue_parser.add_argument('--run-id', help='Filter by run')
+    
+    # Snapshot commands
+    subparsers.add_parser('publish', help='Publish read snapshot for the API')
+    subparsers.add_parser('rollback', help='Roll back to previous read snapshot')
+    
     args = parser.parse_args()
     
     if args.command == 'scrape':
+        from scripts.run_scraper import main as run_scraper
         run_scraper()
     elif args.command == 'list':
         list_jobs(args)
@@ -88,6 +268,22 @@ def main():
         track_application(args)
     elif args.command == 'applications':
         show_applications(args)
+    elif args.command == 'save-search':
+        save_search(args)
+    elif args.command == 'searches':
+        show_searches(args)
+    elif args.command == 'export':
+        export_jobs(args)
+    elif args.command == 'rescore':
+        rescore(args)
+    elif args.command == 'enqueue':
+        enqueue(args)
+    elif args.command == 'queue':
+        queue_status(args)
+    elif args.command == 'publish':
+        publish(args)
+    elif args.command == 'rollback':
+        rollback(args)
     else:
         parser.print_help()
 
@@ -6,7 +6,10 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from src.models.database import db
 from src.fetchers.adzuna import AdzunaFetcher
 from src.services.deduplicator import is_duplicate, generate_content_hash
-from src.services.notifier import Notifier
+from src.services.alerts import AlertRouter
+from src.services.ingest import ensure_source, notify_new_job
+from src.services.scoring import compute_features
+from src.services.snapshot import publish_snapshot
 from src.utils.logger import setup_logger
 from config.settings import settings
 
@@ -19,16 +22,15 @@ def main():
     logger.info("=" * 60)
     
     # Ensure sources are registered
-    source = db.get_source_by_name('adzuna')
-    if not source:
-        db.insert_source('adzuna', AdzunaFetcher.BASE_URL)
-        source = db.get_source_by_name('adzuna')
-    
-    source_id = source['id']
+    source_id = ensure_source(db, 'adzuna', AdzunaFetcher.BASE_URL)
     
     # Initialize fetcher
     fetcher = AdzunaFetcher()
     
+    # Compile saved searches once per run
+    alerts = AlertRouter(db)
+    logger.info(f"Loaded {alerts.matcher.size} saved searches")
+    
     total_new_jobs = 0
     total_duplicates = 0
     
@@ -46,27 +48,30 @@ def main():
                 total_duplicates += 1
                 continue
             
-            # Insert new job
+            # Insert new job with its relevance features
+            job['features'] = compute_features(job)
             job_id = db.insert_job(job)
             
             if job_id:
                 total_new_jobs += 1
                 logger.info(f"New job found: {job['title']} at {job['company']}")
                 
-                # Send notifications
                 job['id'] = job_id
-                notification_results = Notifier.notify(job)
                 
-                # Record notifications
-                for channel, success in notification_results.items():
-                    if success:
-                        db.record_notification(job_id, channel)
+                # Route to saved-search matches; without any, notify on every job
+                notify_new_job(db, job, alerts)
     
     logger.info("=" * 60)
     logger.info(f"Scraper finished")
     logger.info(f"New jobs: {total_new_jobs}")
     logger.info(f"Duplicates skipped: {total_duplicates}")
     logger.info("=" * 60)
+    
+    # Publish a fresh read snapshot for the API
+    try:
+        publish_snapshot(db)
+    except Exception as e:
+        logger.exception(f"Snapshot publish failed, API keeps previous snapshot: {e}")
 
 if __name__ == '__main__':
     try:
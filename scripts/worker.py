@@ -0,0 +1,36 @@
+# scripts/worker.py
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+from src.models.database import db
+from src.services.task_queue import get_queue
+from src.services.worker import Worker
+from src.services.snapshot import publish_snapshot
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+def main():
+    parser = argparse.ArgumentParser(description='Scrape task worker')
+    parser.add_argument('--worker-id', help='Worker name (default: host-pid)')
+    parser.add_argument('--forever', action='store_true', help='Keep polling after the queue drains')
+    parser.add_argument('--publish', action='store_true', help='Publish a read snapshot once the queue drains')
+    args = parser.parse_args()
+    
+    queue = get_queue(db)
+    worker = Worker(queue, db, worker_id=args.worker_id)
+    completed = worker.run(exit_when_idle=not args.forever)
+    
+    if args.publish and completed and not queue.outstanding():
+        publish_snapshot(db)
+
+if __name__ == '__main__':
+    try:
+        main()
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        logger.exception(f"Worker crashed: {e}")
+        sys.exit(1)
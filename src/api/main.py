@@ -1,9 +1,12 @@
 # src/api/main.py
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime
 from src.models.database import db
+from src.services.exporter import EXPORT_FORMATS, MEDIA_TYPES, iter_export, parquet_available
+from src.services.snapshot import SnapshotReader
 
 app = FastAPI(
     title="Job Scraper API",
@@ -11,6 +14,9 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Job reads come from the published snapshot, isolated from scraper writes
+reader = SnapshotReader(db)
+
 # Pydantic models
 class Job(BaseModel):
     id: int
@@ -22,6 +28,7 @@ class Job(BaseModel):
     salary_max: Optional[float] = None
     url: str
     posted_date: Optional[str] = None
+    score: Optional[float] = None
 
 class Application(BaseModel):
     id: int
@@ -33,6 +40,19 @@ class Application(BaseModel):
     company: str
     url: str
 
+class SavedSearchIn(BaseModel):
+    user: str
+    name: Optional[str] = None
+    keywords: List[str] = []
+    locations: List[str] = []
+    salary_min: Optional[int] = None
+    experience_level: Optional[str] = None
+    channels: List[str] = ["email", "discord"]
+
+class SavedSearch(SavedSearchIn):
+    id: int
+    created_at: str
+
 # Endpoints
 @app.get("/")
 def root():
@@ -40,23 +60,50 @@ def root():
     return {
         "status": "healthy",
         "version": "1.0.0",
-        "endpoints": ["/jobs", "/jobs/{id}", "/applications"]
+        "endpoints": ["/jobs", "/jobs/export", "/jobs/{id}", "/applications", "/searches"]
     }
 
 @app.get("/jobs", response_model=List[Job])
 def list_jobs(
     keyword: Optional[str] = None,
     location: Optional[str] = None,
-    limit: int = Query(default=50, le=100)
+    limit: int = Query(default=50, le=100),
+    sort: Optional[str] = Query(default=None, pattern="^relevance$")
 ):
-    """List jobs with optional filters"""
-    jobs = db.query_jobs(keyword=keyword, location=location, limit=limit)
+    """List jobs with optional filters, optionally ranked by relevance"""
+    if sort == "relevance":
+        if not reader.supports_ranking():
+            raise HTTPException(
+                status_code=409,
+                detail="Current snapshot predates relevance ranking; publish a new snapshot"
+            )
+        from src.services.scoring import rank_jobs
+        return rank_jobs(reader, keyword=keyword, location=location, limit=limit)
+
+    jobs = reader.query_jobs(keyword=keyword, location=location, limit=limit)
     return jobs
 
+@app.get("/jobs/export")
+def export_jobs(
+    format: str = Query(default="ndjson", pattern="^(" + "|".join(EXPORT_FORMATS) + ")$"),
+    keyword: Optional[str] = None,
+    location: Optional[str] = None
+):
+    """Stream all matching jobs as NDJSON, CSV or Parquet"""
+    if format == "parquet" and not parquet_available():
+        raise HTTPException(status_code=400, detail="Parquet export requires pyarrow")
+
+    batches = reader.iter_job_batches(keyword=keyword, location=location)
+    return StreamingResponse(
+        iter_export(batches, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="jobs.{format}"'}
+    )
+
 @app.get("/jobs/{job_id}", response_model=Job)
 def get_job(job_id: int):
     """Get specific job by ID"""
-    job = db.get_job(job_id)
+    job = reader.get_job(job_id)
     
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -80,14 +127,37 @@ def list_applications(status: Optional[str] = None):
     apps = db.get_applications(status=status)
     return apps
 
+@app.post("/searches", status_code=201)
+def create_saved_search(search: SavedSearchIn):
+    """Save an alert search"""
+    search_id = db.insert_saved_search(**search.model_dump())
+    return {"id": search_id, "user": search.user}
+
+@app.get("/searches", response_model=List[SavedSearch])
+def list_saved_searches(user: Optional[str] = None):
+    """List active saved searches"""
+    return db.get_saved_searches(user=user)
+
+@app.delete("/searches/{search_id}", status_code=204)
+def delete_saved_search(search_id: int):
+    """Stop alerting on a saved search"""
+    if not db.deactivate_saved_search(search_id):
+        raise HTTPException(status_code=404, detail="Saved search not found")
+
 @app.get("/stats")
 def get_stats():
     """Get scraper statistics"""
-    total_jobs = len(db.query_jobs(limit=100000))
-    total_apps = len(db.get_applications())
+    snapshot = reader.get_stats()
+    if snapshot:
+        total_jobs = int(snapshot['total_jobs'])
+        total_apps = int(snapshot['total_applications'])
+    else:
+        total_jobs = len(db.query_jobs(limit=100000))
+        total_apps = len(db.get_applications())
     
     return {
         "total_jobs": total_jobs,
         "total_applications": total_apps,
-        "application_rate": f"{(total_apps/total_jobs*100):.1f}%" if total_jobs > 0 else "0%"
+        "application_rate": f"{(total_apps/total_jobs*100):.1f}%" if total_jobs > 0 else "0%",
+        "snapshot_published_at": snapshot['published_at'] if snapshot else None
     }
\ No newline at end of file
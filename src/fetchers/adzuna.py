@@ -14,13 +14,15 @@ class AdzunaFetcher(BaseFetcher):
         self.app_key = settings.ADZUNA_APP_KEY
 
     
-    def fetch_jobs(self, keyword, location='us'):
+    def fetch_jobs(self, keyword, location='us', page=1, raise_errors=False):
         """
         Fetch jobs from Adzuna
 
         Args:
             keyword : 'python developer'
             location: 'us'
+            page: 1-based results page
+            raise_errors: Re-raise request and non-2xx errors (queue workers retry them)
         
         Returns:
             List of normalized job dictionaries
@@ -29,7 +31,7 @@ class AdzunaFetcher(BaseFetcher):
             self.logger.warning("Adzuna API credentials not configured")
             return []
 
-        url = f'{self.BASE_URL}/{location}/search/1'
+        url = f'{self.BASE_URL}/{location}/search/{page}'
 
         parms = {
             'app_id' :  self.app_id,
@@ -67,9 +69,13 @@ class AdzunaFetcher(BaseFetcher):
             
         except requests.RequestException as e:
             self.logger.error(f"Adzuna API error: {e}")
+            if raise_errors:
+                raise
             return []
         except Exception as e:
             self.logger.exception(f"Unexpected error fetching from Adzuna: {e}")
+            if raise_errors:
+                raise
             return []
         
     
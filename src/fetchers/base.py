@@ -11,8 +11,13 @@ class BaseFetcher(ABC):
         self.logger = logger
     
     @abstractmethod
-    def fetch_jobs(self, keyword, location=None):
-        #Fetch jobs from source
+    def fetch_jobs(self, keyword, location=None, page=1, raise_errors=False):
+        #Fetch one page of jobs from source
+        #raise_errors: re-raise fetch errors instead of logging and returning []
+        pass
+
+    def close(self):
+        #Release anything kept between fetches (sessions, browsers)
         pass
     
     def normalize_job(self, raw_job):
@@ -0,0 +1,367 @@
+import asyncio
+import threading
+from abc import abstractmethod
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus, urljoin, urlparse
+
+import requests
+from bs4 import BeautifulSoup
+
+from .base import BaseFetcher
+from config.settings import settings
+
+try:
+    import lxml  # noqa: F401
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+
+class BrowserPool:
+    """
+    Pool of reusable headless browser contexts
+
+    One Chromium process is launched per pool and pages are rendered in a
+    fixed set of contexts, so each page costs a tab rather than a browser
+    launch. Images, fonts, media and known trackers are aborted at the
+    network layer.
+
+    Usage:
+        async with BrowserPool(size=4) as pool:
+            html = await pool.render(url)
+    """
+
+    def __init__(self, size=None, blocked_resource_types=None, blocked_domains=None):
+        self.size = size or settings.BROWSER_POOL_SIZE
+        self.blocked_resource_types = set(blocked_resource_types or settings.BLOCKED_RESOURCE_TYPES)
+        self.blocked_domains = tuple(blocked_domains or settings.BLOCKED_DOMAINS)
+        self._playwright = None
+        self._browser = None
+        self._contexts = None
+        # Aborted requests by resource type
+        self.aborted = Counter()
+
+    async def __aenter__(self):
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self._contexts = asyncio.Queue()
+
+            for _ in range(self.size):
+                context = await self._browser.new_context()
+                await context.route('**/*', self._route)
+                self._contexts.put_nowait(context)
+        except BaseException:
+            # Don't leak the driver (or a half-built browser) on a failed launch
+            await self.close()
+            raise
+
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close every context, the browser and the Playwright driver"""
+        if self._contexts is not None:
+            while not self._contexts.empty():
+                await self._contexts.get_nowait().close()
+            self._contexts = None
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def is_blocked(self, resource_type, url):
+        """Check whether a request should be aborted"""
+        if resource_type in self.blocked_resource_types:
+            return True
+
+        host = urlparse(url).hostname or ''
+        return any(host == domain or host.endswith('.' + domain) for domain in self.blocked_domains)
+
+    async def _route(self, route):
+        request = route.request
+        if self.is_blocked(request.resource_type, request.url):
+            self.aborted[request.resource_type] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def render(self, url, wait_for=None):
+        """
+        Render a page in the next free context
+
+        Args:
+            url: Page to load
+            wait_for: Optional CSS selector to wait for before reading the DOM
+
+        Returns:
+            Rendered HTML
+        """
+        timeout = settings.REQUEST_TIMEOUT * 1000
+        context = await self._contexts.get()
+        page = await context.new_page()
+
+        try:
+            await page.goto(url, wait_until='domcontentloaded', timeout=timeout)
+            if wait_for:
+                await page.wait_for_selector(wait_for, timeout=timeout)
+            return await page.content()
+        finally:
+            await page.close()
+            self._contexts.put_nowait(context)
+
+class HTMLFetcher(BaseFetcher):
+    """
+    Base class for fetchers that scrape HTML career pages
+
+    Pages that serve their listings in the initial HTML are downloaded
+    concurrently over a kept-alive HTTP session and parsed directly with
+    lxml. Set requires_js for pages that only render listings client-side;
+    those go through a BrowserPool that is launched on first use and kept,
+    with its event loop on a background thread, until close(). Reuse one
+    fetcher across calls (queue workers do) so each page costs a tab
+    rather than a browser launch.
+
+    Usage:
+        with CareerPageFetcher(...) as fetcher:
+            jobs = fetcher.fetch_all_pages('python developer')
+    """
+
+    def __init__(self, source_name, requires_js=False, wait_for=None, concurrency=None):
+        super().__init__(source_name)
+        self.requires_js = requires_js
+        self.wait_for = wait_for
+        self.concurrency = concurrency or settings.BROWSER_POOL_SIZE
+        self._lock = threading.Lock()
+        self._session = None
+        self._loop = None
+        self._loop_thread = None
+        self._pool = None
+        self._pool_lock = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @abstractmethod
+    def build_urls(self, keyword, location=None):
+        #Return the page URLs to scrape for a search
+        pass
+
+    @abstractmethod
+    def parse_jobs(self, soup, page_url):
+        #Extract normalized jobs from a parsed page
+        pass
+
+    def fetch_jobs(self, keyword, location=None, page=1, raise_errors=False):
+        """
+        Fetch and parse one page of a search
+
+        Args:
+            keyword : 'python developer'
+            location: 'remote'
+            page: 1-based page
+            raise_errors: Re-raise download, non-2xx and render errors instead
+                of skipping the page (queue workers retry them)
+
+        Returns:
+            List of normalized job dictionaries
+        """
+        urls = self.build_urls(keyword, location)[max(page, 1) - 1:page]
+        return self._fetch_urls(urls, keyword, raise_errors)
+
+    def fetch_all_pages(self, keyword, location=None, raise_errors=False):
+        """Fetch and parse every page of a search concurrently"""
+        return self._fetch_urls(self.build_urls(keyword, location), keyword, raise_errors)
+
+    def close(self):
+        """Close the browser pool and HTTP session kept between calls"""
+        with self._lock:
+            loop, self._loop = self._loop, None
+            session, self._session = self._session, None
+
+        if loop is not None:
+            if self._pool is not None:
+                asyncio.run_coroutine_threadsafe(self._pool.close(), loop).result()
+                self._pool = None
+            self._pool_lock = None
+            loop.call_soon_threadsafe(loop.stop)
+            self._loop_thread.join()
+            loop.close()
+
+        if session is not None:
+            session.close()
+
+    def _fetch_urls(self, urls, keyword, raise_errors):
+        if not urls:
+            return []
+
+        self.logger.info(f"Fetching {len(urls)} pages from {self.source_name}: {keyword}")
+
+        try:
+            if self.requires_js:
+                pages = self._run(self._render_pages(urls, raise_errors))
+            else:
+                pages = self._download_pages(urls, raise_errors)
+        except Exception as e:
+            self.logger.exception(f"Unexpected error fetching from {self.source_name}: {e}")
+            if raise_errors:
+                raise
+            return []
+
+        jobs = []
+        for url, html in pages:
+            if html is None:
+                continue
+            soup = BeautifulSoup(html, PARSER)
+            jobs.extend(self.parse_jobs(soup, url))
+
+        self.logger.info(f"Fetched {len(jobs)} jobs from {self.source_name}")
+        return jobs
+
+    def _get_session(self):
+        with self._lock:
+            if self._session is None:
+                self._session = requests.Session()
+            return self._session
+
+    def _download_pages(self, urls, raise_errors=False):
+        session = self._get_session()
+        if len(urls) == 1:
+            return [(urls[0], self._download(session, urls[0], raise_errors))]
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            return list(executor.map(lambda url: (url, self._download(session, url, raise_errors)), urls))
+
+    def _download(self, session, url, raise_errors=False):
+        try:
+            response = session.get(url, timeout=settings.REQUEST_TIMEOUT)
+            response.raise_for_status()
+            return response.text
+        except requests.RequestException as e:
+            self.logger.error(f"{self.source_name} page error ({url}): {e}")
+            if raise_errors:
+                raise
+            return None
+
+    def _run(self, coro):
+        # The browser pool lives on one event loop for the fetcher's lifetime,
+        # so calls from any thread are handed to that loop
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name=f"{self.source_name}-browser", daemon=True
+                )
+                self._loop_thread.start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def _get_pool(self):
+        # Runs on the loop thread only; the lock covers the awaits in launch
+        if self._pool_lock is None:
+            self._pool_lock = asyncio.Lock()
+        async with self._pool_lock:
+            if self._pool is None:
+                pool = BrowserPool(size=self.concurrency)
+                await pool.__aenter__()
+                self._pool = pool
+        return self._pool
+
+    async def _render_pages(self, urls, raise_errors=False):
+        pool = await self._get_pool()
+        return await asyncio.gather(*(self._render(pool, url, raise_errors) for url in urls))
+
+    async def _render(self, pool, url, raise_errors=False):
+        try:
+            return url, await pool.render(url, wait_for=self.wait_for)
+        except Exception as e:
+            self.logger.error(f"{self.source_name} render error ({url}): {e}")
+            if raise_errors:
+                raise
+            return url, None
+
+class CareerPageFetcher(HTMLFetcher):
+    """
+    Scrape a career page described by CSS selectors
+
+    Example:
+        CareerPageFetcher(
+            'acme',
+            'https://acme.com/careers?q={keyword}&where={location}',
+            selectors={
+                'job': 'li.opening',
+                'title': 'h3',
+                'location': '.location',
+                'link': 'a',
+            },
+            company='Acme'
+        )
+
+    'job' selects one element per listing; the other selectors are applied
+    inside it. 'company' and 'description' are optional, and the listing's
+    absolute URL is used as its external_id unless an 'id' attribute name
+    is given.
+    """
+
+    def __init__(self, source_name, url_template, selectors, company=None, pages=1, **kwargs):
+        super().__init__(source_name, **kwargs)
+        self.url_template = url_template
+        self.selectors = selectors
+        self.company = company
+        self.pages = pages
+
+    def build_urls(self, keyword, location=None):
+        return [
+            self.url_template.format(
+                keyword=quote_plus(keyword),
+                location=quote_plus(location or ''),
+                page=page
+            )
+            for page in range(1, self.pages + 1)
+        ]
+
+    def parse_jobs(self, soup, page_url):
+        jobs = []
+
+        for card in soup.select(self.selectors['job']):
+            link = card.select_one(self.selectors['link']) if self.selectors.get('link') else None
+            href = link.get('href') if link else None
+            url = urljoin(page_url, href) if href else page_url
+
+            id_attr = self.selectors.get('id')
+            external_id = card.get(id_attr) if id_attr else None
+
+            title = self._text(card, 'title')
+            if not title:
+                continue
+
+            jobs.append({
+                'external_id': external_id or url,
+                'title': title,
+                'company': self._text(card, 'company') or self.company or 'Unknown',
+                'location': self._text(card, 'location'),
+                'description': self._text(card, 'description'),
+                'url': url,
+                'job_type': None,
+                'salary_min': None,
+                'salary_max': None,
+                'posted_date': None
+            })
+
+        return jobs
+
+    def _text(self, card, field):
+        selector = self.selectors.get(field)
+        if not selector:
+            return ''
+        element = card.select_one(selector)
+        return element.get_text(' ', strip=True) if element else ''
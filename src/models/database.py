@@ -1,84 +1,224 @@
+import json
 import sqlite3
 from contextlib import contextmanager
 from datetime import datetime
 from config.settings import settings
 import os
 
+def _backfill_job_features(conn, batch_size=1000):
+    # Jobs stored before job_features existed would be left out of ranking.
+    # Imported here so only an upgrading process loads the scoring code
+    from src.services.scoring import compute_features
+
+    cursor = conn.execute(
+        '''SELECT jobs.* FROM jobs
+           LEFT JOIN job_features f ON f.job_id = jobs.id
+           WHERE f.job_id IS NULL'''
+    )
+    cursor.row_factory = sqlite3.Row
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        conn.executemany(
+            'INSERT INTO job_features (job_id, features) VALUES (?, ?)',
+            [(row['id'], compute_features(dict(row))) for row in rows]
+        )
+
+# Schema migrations, applied in order and tracked with PRAGMA user_version.
+# Entries are SQL scripts, or functions of the connection for data backfills.
+# Append new entries; never edit one that has shipped. Each step runs once,
+# under the write lock, so it may use ALTER TABLE and other non-idempotent
+# statements. The first steps use IF NOT EXISTS so databases created before
+# versioning (user_version 0) upgrade cleanly.
+MIGRATIONS = [
+    # 1: initial schema
+    '''
+            CREATE TABLE IF NOT EXISTS sources (
+                           id INTEGER PRIMARY KEY AUTOINCREMENT,
+                           name TEXT NOT NULL UNIQUE,
+                           base_url TEXT NOT NULL,
+                           api_key TEXT,
+                           is_active BOOLEAN DEFAULT 1,
+                           last_scrapped_at TIMESTAMP,
+                           created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP         
+            );   
+
+            CREATE TABLE IF NOT EXISTS jobs(
+                           id INTEGER PRIMARY KEY AUTOINCREMENT,
+                           source_id INTEGER NOT NULL,
+                           external_id TEXT NOT NULL,
+                           title TEXT NOT NULL,
+                           company TEXT NOT NULL,
+                           location TEXT NOT NULL,
+                           description TEXT NOT NULL,
+                           job_type TEXT,
+                           experience_level TEXT,
+                           salary_min INTEGER,
+                           salary_max INTEGER,
+                           salary_currency TEXT DEFAULT 'USD', 
+                           url TEXT NOT NULL,
+                           posted_date TIMESTAMP,
+                           scrapped_at TIMESTAMP CURRENT_TIMESTAMP,
+                           is_active BOOLEAN DEFAULT 1,
+                           content_hash TEXT,
+
+                           FOREIGN KEY (source_id) REFERENCES sources(id), UNIQUE(source_id, external_id)
+            );
+            
+            CREATE INDEX IF NOT EXISTS idx_jobs_title ON jobs(title);
+            CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs(location);
+            CREATE INDEX IF NOT EXISTS idx_jobs_posted_date ON jobs(posted_date DESC);
+            CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+            CREATE INDEX IF NOT EXISTS idx_content_hash ON jobs(content_hash);
+                           
+            CREATE TABLE IF NOT EXISTS applications (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id INTEGER NOT NULL,
+                status TEXT NOT NULL DEFAULT 'applied',
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                notes TEXT,
+                resume_version TEXT,
+                
+                FOREIGN KEY (job_id) REFERENCES jobs(id)
+            );
+            
+            CREATE TABLE IF NOT EXISTS notifications (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id INTEGER NOT NULL,
+                channel TEXT NOT NULL,
+                sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                status TEXT DEFAULT 'sent',
+                
+                FOREIGN KEY (job_id) REFERENCES jobs(id)
+            );
+    ''',
+    # 2: saved searches for alerts
+    '''
+            CREATE TABLE IF NOT EXISTS saved_searches (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user TEXT NOT NULL,
+                name TEXT,
+                keywords TEXT NOT NULL DEFAULT '[]',
+                locations TEXT NOT NULL DEFAULT '[]',
+                salary_min INTEGER,
+                experience_level TEXT,
+                channels TEXT NOT NULL DEFAULT '["email", "discord"]',
+                is_active BOOLEAN DEFAULT 1,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_saved_searches_user ON saved_searches(user);
+    ''',
+    # 3: scrape task queue
+    '''
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT NOT NULL,
+                source TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                location TEXT NOT NULL DEFAULT '',
+                page INTEGER NOT NULL DEFAULT 1,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_owner TEXT,
+                lease_expires_at REAL,
+                result_count INTEGER,
+                error TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                finished_at TIMESTAMP,
+
+                UNIQUE(run_id, source, keyword, location, page)
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_tasks_claim ON tasks(status, lease_expires_at);
+    ''',
+    # 4: packed relevance features (see src/services/scoring.py)
+    '''
+            CREATE TABLE IF NOT EXISTS job_features (
+                job_id INTEGER PRIMARY KEY,
+                features BLOB NOT NULL,
+
+                FOREIGN KEY (job_id) REFERENCES jobs(id)
+            );
+    ''',
+    # 5: features for jobs stored before migration 4
+    _backfill_job_features,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+def _statements(script):
+    # Split a migration into single statements; complete_statement keeps
+    # semicolons inside triggers and string literals together
+    statement = ''
+    for part in script.split(';'):
+        statement += part + ';'
+        if sqlite3.complete_statement(statement):
+            if statement.strip(' \t\n;'):
+                yield statement.strip()
+            statement = ''
+
+# Both aggregates walk the same rows in the same order, so ids line up with
+# the packed features; the CAST keeps the concatenated blobs as raw bytes
+CANDIDATE_FEATURES_QUERY = {
+    'columns': "group_concat(f.job_id), CAST(group_concat(f.features, '') AS BLOB)",
+    'joins': 'JOIN job_features f ON f.job_id = jobs.id',
+}
+
 class Database:
     def __init__(self, db_path = None):
         self.db_path = db_path or settings.DATABASE_PATH
-        self.ensure_db_exists()
+        # Schema is checked lazily on first connection, not at import
+        self._schema_ready = False
 
     def ensure_db_exists(self):
-        #Create db and tables if they don't exists yet
-        os.makedirs(os.path.dirname(self.db_path), exist_ok = True)
+        #Create db and apply any pending migrations
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok = True)
 
-        with self.get_connection() as conn:
-            conn.executescript('''
-                CREATE TABLE IF NOT EXISTS sources (
-                               id INTEGER PRIMARY KEY AUTOINCREMENT,
-                               name TEXT NOT NULL UNIQUE,
-                               base_url TEXT NOT NULL,
-                               api_key TEXT,
-                               is_active BOOLEAN DEFAULT 1,
-                               last_scrapped_at TIMESTAMP,
-                               created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP         
-                );   
-
-                CREATE TABLE IF NOT EXISTS jobs(
-                               id INTEGER PRIMARY KEY AUTOINCREMENT,
-                               source_id INTEGER NOT NULL,
-                               external_id TEXT NOT NULL,
-                               title TEXT NOT NULL,
-                               company TEXT NOT NULL,
-                               location TEXT NOT NULL,
-                               description TEXT NOT NULL,
-                               job_type TEXT,
-                               experience_level TEXT,
-                               salary_min INTEGER,
-                               salary_max INTEGER,
-                               salary_currency TEXT DEFAULT 'USD', 
-                               url TEXT NOT NULL,
-                               posted_date TIMESTAMP,
-                               scrapped_at TIMESTAMP CURRENT_TIMESTAMP,
-                               is_active BOOLEAN DEFAULT 1,
-                               content_hash TEXT,
-
-                               FOREIGN KEY (source_id) REFERENCES sources(id), UNIQUE(source_id, external_id)
-                );
-                
-                CREATE INDEX IF NOT EXISTS idx_jobs_title ON jobs(title);
-                CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs(location);
-                CREATE INDEX IF NOT EXISTS idx_jobs_posted_date ON jobs(posted_date DESC);
-                CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
-                CREATE INDEX IF NOT EXISTS idx_content_hash ON jobs(content_hash);
-                               
-                CREATE TABLE IF NOT EXISTS applications (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    job_id INTEGER NOT NULL,
-                    status TEXT NOT NULL DEFAULT 'applied',
-                    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    notes TEXT,
-                    resume_version TEXT,
-                    
-                    FOREIGN KEY (job_id) REFERENCES jobs(id)
-                );
-                
-                CREATE TABLE IF NOT EXISTS notifications (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    job_id INTEGER NOT NULL,
-                    channel TEXT NOT NULL,
-                    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    status TEXT DEFAULT 'sent',
-                    
-                    FOREIGN KEY (job_id) REFERENCES jobs(id)
-                );               
-                    ''')
+        conn = sqlite3.connect(self.db_path, timeout=settings.DB_BUSY_TIMEOUT, isolation_level=None)
+        try:
+            if conn.execute('PRAGMA user_version').fetchone()[0] < SCHEMA_VERSION:
+                self._migrate(conn)
+        finally:
+            conn.close()
+
+        self._schema_ready = True
+
+    @staticmethod
+    def _migrate(conn):
+        # BEGIN IMMEDIATE takes the write lock before user_version is read, so
+        # processes starting together wait here and then skip applied steps
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            for number in range(version + 1, SCHEMA_VERSION + 1):
+                step = MIGRATIONS[number - 1]
+                if callable(step):
+                    step(conn)
+                else:
+                    for statement in _statements(step):
+                        conn.execute(statement)
+                # user_version is transactional, so it commits with the steps
+                conn.execute(f'PRAGMA user_version = {number}')
+            conn.execute('COMMIT')
+        except:
+            conn.execute('ROLLBACK')
+            raise
     
     @contextmanager
-    def get_connection(self): 
+    def get_connection(self, check_same_thread=True): 
         #context manager for database connections
-        conn = sqlite3.connect(self.db_path)
+        if not self._schema_ready:
+            self.ensure_db_exists()
+
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=settings.DB_BUSY_TIMEOUT,
+            check_same_thread=check_same_thread
+        )
         conn.row_factory = sqlite3.Row
         try:
             yield conn
@@ -105,38 +245,120 @@ class Database:
                 (name,) ).fetchone()
             return dict(row) if row else None; 
 
+    JOB_INSERT_SQL = '''
+        INSERT INTO jobs (
+            source_id, external_id, title, company, location,
+            description, job_type, experience_level,
+            salary_min, salary_max, salary_currency,
+            url, posted_date, content_hash
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
+    @staticmethod
+    def _job_params(job_data):
+        return (
+            job_data['source_id'],
+            job_data['external_id'],
+            job_data['title'],
+            job_data['company'],
+            job_data.get('location'),
+            job_data.get('description'),
+            job_data.get('job_type'),
+            job_data.get('experience_level'),
+            job_data.get('salary_min'),
+            job_data.get('salary_max'),
+            job_data.get('salary_currency', 'USD'),
+            job_data['url'],
+            job_data.get('posted_date'),
+            job_data.get('content_hash')
+        )
+
     def insert_job(self, job_data):
         #insert a new job
         with self.get_connection() as conn:
             try:
-                    cursor = conn.execute('''
-                        INSERT INTO jobs (
-                            source_id, external_id, title, company, location,
-                            description, job_type, experience_level,
-                            salary_min, salary_max, salary_currency,
-                            url, posted_date, content_hash
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        job_data['source_id'],
-                        job_data['external_id'],
-                        job_data['title'],
-                        job_data['company'],
-                        job_data.get('location'),
-                        job_data.get('description'),
-                        job_data.get('job_type'),
-                        job_data.get('experience_level'),
-                        job_data.get('salary_min'),
-                        job_data.get('salary_max'),
-                        job_data.get('salary_currency', 'USD'),
-                        job_data['url'],
-                        job_data.get('posted_date'),
-                        job_data.get('content_hash')
-                    ))
+                    cursor = conn.execute(self.JOB_INSERT_SQL, self._job_params(job_data))
+                    self._insert_features(conn, cursor.lastrowid, job_data)
                     return cursor.lastrowid
             except sqlite3.IntegrityError:
                     # Duplicate job
                     return None 
 
+    def insert_jobs(self, jobs):
+        """
+        Insert a batch of jobs in a single write transaction
+
+        Jobs whose content_hash is already stored (including earlier in the
+        same batch) or whose (source_id, external_id) exists are skipped, so
+        re-ingesting the same batch is a no-op.
+
+        Returns:
+            The newly inserted jobs, each with its 'id' set
+        """
+        inserted = []
+        with self.get_connection() as conn:
+            # Take the write lock up front so concurrent writers queue on the
+            # busy timeout instead of deadlocking on a lock upgrade
+            conn.execute('BEGIN IMMEDIATE')
+            for job_data in jobs:
+                content_hash = job_data.get('content_hash')
+                if content_hash and conn.execute(
+                    'SELECT 1 FROM jobs WHERE content_hash = ? AND is_active = 1',
+                    (content_hash,) ).fetchone():
+                    continue
+
+                try:
+                    cursor = conn.execute(self.JOB_INSERT_SQL, self._job_params(job_data))
+                except sqlite3.IntegrityError:
+                    continue
+
+                job_data['id'] = cursor.lastrowid
+                self._insert_features(conn, job_data['id'], job_data)
+                inserted.append(job_data)
+        return inserted
+
+    @staticmethod
+    def _insert_features(conn, job_id, job_data):
+        if job_data.get('features') is not None:
+            conn.execute(
+                'INSERT OR REPLACE INTO job_features (job_id, features) VALUES (?, ?)',
+                (job_id, job_data['features'])
+            )
+
+    def rebuild_job_features(self, compute, batch_size=1000):
+        """
+        Recompute packed features for every job
+
+        Reads and writes share one connection, because a second writer
+        connection would wait on this reader's lock.
+
+        Args:
+            compute: Function mapping a job dictionary to its feature blob
+
+        Returns:
+            Number of jobs rescored
+        """
+        total = 0
+        with self.get_connection() as conn:
+            cursor = conn.execute('SELECT * FROM jobs ORDER BY id')
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                conn.executemany(
+                    'INSERT OR REPLACE INTO job_features (job_id, features) VALUES (?, ?)',
+                    [(row['id'], compute(dict(row))) for row in rows]
+                )
+                total += len(rows)
+        return total
+
+    def get_job(self, job_id):
+        with self.get_connection() as conn:
+            row = conn.execute(
+                'SELECT * FROM jobs WHERE id = ?',
+                (job_id,) ).fetchone()
+            return dict(row) if row else None
+
     def job_exists_by_hash(self,content_hash):
             #check if job exists by content hash
             with self.get_connection() as conn:
@@ -146,9 +368,9 @@ class Database:
                 return row is not None
                 
 
-    def query_jobs(self, keyword=None, location=None, limit=50):
-            #Query jobs with filter
-            query = 'SELECT * FROM jobs WHERE is_active =1'
+    def _job_filters(self, keyword=None, location=None, columns='*', joins=''):
+            #Build the WHERE clause shared by query_jobs, iter_job_batches and ranking
+            query = f'SELECT {columns} FROM jobs {joins} WHERE is_active =1'
             parms = []
 
             if keyword:
@@ -159,11 +381,66 @@ class Database:
             if location:
                 query += ' AND location LIKE ?'
                 parms.append(f'%{location}%')
+
+            return query, parms
+
+    def query_jobs(self, keyword=None, location=None, limit=50):
+            #Query jobs with filter
+            query, parms = self._job_filters(keyword, location)
         
             with self.get_connection() as conn:
                 rows = conn.execute(query, parms).fetchall()
                 return [dict(row) for row in rows]
-    
+
+    def iter_job_batches(self, keyword=None, location=None, batch_size=1000):
+            """
+            Stream matching jobs in batches without loading the whole result set
+
+            Keyset pagination on id: each batch is its own short read, so
+            only one batch is held in memory and no read transaction stays
+            open while a slow consumer works through the export, which would
+            lock writers out of the database.
+
+            Yields:
+                Lists of up to batch_size job dictionaries, ordered by id
+            """
+            query, parms = self._job_filters(keyword, location)
+            query += ' AND id > ? ORDER BY id LIMIT ?'
+
+            last_id = 0
+            while True:
+                with self.get_connection() as conn:
+                    rows = conn.execute(query, parms + [last_id, batch_size]).fetchall()
+                if not rows:
+                    break
+                last_id = rows[-1]['id']
+                yield [dict(row) for row in rows]
+                if len(rows) < batch_size:
+                    break
+
+    def candidate_features(self, keyword=None, location=None):
+            """
+            Packed features of every job matching the filters
+
+            Aggregated inside SQLite so 100k candidates come back as one row
+            rather than 100k Python tuples.
+
+            Returns:
+                (comma-separated job ids, concatenated feature blobs in the same order)
+            """
+            query, parms = self._job_filters(keyword, location, **CANDIDATE_FEATURES_QUERY)
+
+            with self.get_connection() as conn:
+                ids, packed = conn.execute(query, parms).fetchone()
+                return ids or '', packed or b''
+
+    def get_jobs_by_ids(self, job_ids):
+            placeholders = ','.join('?' * len(job_ids))
+            with self.get_connection() as conn:
+                rows = conn.execute(
+                    f'SELECT * FROM jobs WHERE id IN ({placeholders})',
+                    list(job_ids) ).fetchall()
+                return [dict(row) for row in rows]
 
     def track_applicatoin(self, job_id, notes=None):
             with self.get_connection() as conn:
@@ -173,7 +450,8 @@ class Database:
                 )
                 return cursor.lastrowid
 
-    def get_application(self, status=None):
+    def get_applications(self, status=None):
+            #Get applications with their job, newest first
             query = '''
                 SELECT a.*, j.title, j.company, j.url
                 FROM applications a 
@@ -182,13 +460,13 @@ class Database:
             parms = []
 
             if status:
-                query += 'WHERE a.status = ?'
+                query += ' WHERE a.status = ?'
                 parms.append(status)
         
-            query += 'ORDER BY a.applied_at DESC'
+            query += ' ORDER BY a.applied_at DESC'
 
             with self.get_connection() as conn:
-                rows = conn.execute(query, parms).fetachall()
+                rows = conn.execute(query, parms).fetchall()
                 return [dict(row) for row in rows]
             
     def record_notification(self, job_id, channel):
@@ -198,5 +476,55 @@ class Database:
                 'INSERT INTO notifications (job_id, channel) VALUES (?, ?)',
                 (job_id, channel)
             )
+
+
+    def insert_saved_search(self, user, keywords=None, locations=None, salary_min=None,
+                            experience_level=None, channels=None, name=None):
+        """Save an alert search for a user"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                '''INSERT INTO saved_searches
+                   (user, name, keywords, locations, salary_min, experience_level, channels)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)''',
+                (
+                    user,
+                    name,
+                    json.dumps(keywords or []),
+                    json.dumps(locations or []),
+                    salary_min,
+                    experience_level,
+                    json.dumps(channels or ['email', 'discord'])
+                )
+            )
+            return cursor.lastrowid
+
+    def get_saved_searches(self, user=None):
+        """Get active saved searches, optionally for one user"""
+        query = 'SELECT * FROM saved_searches WHERE is_active = 1'
+        parms = []
+
+        if user:
+            query += ' AND user = ?'
+            parms.append(user)
+
+        with self.get_connection() as conn:
+            rows = conn.execute(query, parms).fetchall()
+
+        searches = []
+        for row in rows:
+            search = dict(row)
+            for field in ('keywords', 'locations', 'channels'):
+                search[field] = json.loads(search[field])
+            searches.append(search)
+        return searches
+
+    def deactivate_saved_search(self, search_id):
+        """Stop alerting on a saved search"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                'UPDATE saved_searches SET is_active = 0 WHERE id = ?',
+                (search_id,)
+            )
+            return cursor.rowcount > 0
             
 db = Database()
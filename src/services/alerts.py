@@ -0,0 +1,192 @@
+# src/services/alerts.py
+import time
+from collections import defaultdict
+from config.settings import settings
+from src.services.notifier import Notifier
+from src.utils.logger import setup_logger
+from src.utils.text import tokenize
+
+logger = setup_logger(__name__)
+
+def _phrases(values):
+    # Each keyword/location becomes a tuple of tokens; blanks are dropped
+    phrases = []
+    for value in values or []:
+        tokens = tuple(tokenize(value))
+        if tokens:
+            phrases.append(tokens)
+    return phrases
+
+class _CompiledSearch:
+    __slots__ = ('search', 'keywords', 'locations', 'salary_min', 'experience')
+
+    def __init__(self, search):
+        self.search = search
+        self.keywords = _phrases(search.get('keywords'))
+        self.locations = _phrases(search.get('locations'))
+        self.salary_min = search.get('salary_min')
+        self.experience = tuple(tokenize(search.get('experience_level')))
+
+class SavedSearchMatcher:
+    """
+    Match new jobs against every saved search in one pass
+
+    Each search is indexed once under a single token: its keywords when it
+    has any, otherwise its locations, otherwise it goes on a short
+    catch-all list. Matching a job looks up only the job's own tokens, so
+    the cost grows with the job text and the number of real candidates, not
+    with the total number of saved searches. The remaining criteria are then
+    checked for those candidates only.
+
+    Criteria semantics:
+        keywords         - any keyword; every word of it must appear in the
+                           title, company or description
+        locations        - any location; every word must appear in the
+                           job location
+        salary_min       - salary_max (or salary_min) must reach the floor;
+                           jobs without salary data are not excluded
+        experience_level - words must appear in the title or the job's
+                           experience_level
+    """
+
+    def __init__(self, searches):
+        self._keyword_index = defaultdict(list)
+        self._location_index = defaultdict(list)
+        self._catch_all = []
+
+        for search in searches:
+            compiled = _CompiledSearch(search)
+
+            if compiled.keywords:
+                for phrase in compiled.keywords:
+                    self._keyword_index[self._index_token(phrase)].append((phrase, compiled))
+            elif compiled.locations:
+                for phrase in compiled.locations:
+                    self._location_index[self._index_token(phrase)].append((phrase, compiled))
+            else:
+                self._catch_all.append(compiled)
+
+        self.size = len(searches)
+
+    @staticmethod
+    def _index_token(phrase):
+        # Longest word of a phrase is usually the most selective
+        return max(phrase, key=len)
+
+    @staticmethod
+    def _lookup(index, tokens):
+        hits = {}
+        for token in tokens:
+            for phrase, compiled in index.get(token, ()):
+                if len(phrase) == 1 or tokens.issuperset(phrase):
+                    hits[id(compiled)] = compiled
+        return hits
+
+    def match(self, job):
+        """
+        Find saved searches matching a job
+
+        Args:
+            job: Normalized job dictionary
+
+        Returns:
+            List of matching saved search dictionaries
+        """
+        text_tokens = set(tokenize(job.get('title')))
+        title_tokens = set(text_tokens)
+        text_tokens.update(tokenize(job.get('company')))
+        text_tokens.update(tokenize(job.get('description')))
+        location_tokens = set(tokenize(job.get('location')))
+
+        candidates = self._lookup(self._keyword_index, text_tokens)
+        candidates.update(self._lookup(self._location_index, location_tokens))
+
+        matches = []
+        for compiled in list(candidates.values()) + self._catch_all:
+            if self._accepts(compiled, job, title_tokens, location_tokens):
+                matches.append(compiled.search)
+        return matches
+
+    @staticmethod
+    def _accepts(compiled, job, title_tokens, location_tokens):
+        if compiled.keywords and compiled.locations:
+            if not any(location_tokens.issuperset(phrase) for phrase in compiled.locations):
+                return False
+
+        if compiled.salary_min:
+            salary = job.get('salary_max') or job.get('salary_min')
+            if salary and salary < compiled.salary_min:
+                return False
+
+        if compiled.experience:
+            level_tokens = title_tokens.union(tokenize(job.get('experience_level')))
+            if not level_tokens.issuperset(compiled.experience):
+                return False
+
+        return True
+
+class AlertRouter:
+    """
+    Route new jobs to Notifier when any saved search matches
+
+    Notifier sends to the global EMAIL_TO / DISCORD_WEBHOOK, so a job is
+    notified once, on the union of the matching searches' channels, no
+    matter how many users it matches.
+
+    Searches loaded from the database are reloaded by refresh() once they
+    are older than refresh_interval seconds, so long-running workers see
+    searches added or deleted after they started.
+    """
+
+    def __init__(self, db, searches=None, refresh_interval=None):
+        self.db = db
+        self.refresh_interval = (
+            settings.ALERTS_REFRESH_INTERVAL if refresh_interval is None else refresh_interval
+        )
+        self._static = searches is not None
+        self._load(searches)
+
+    def _load(self, searches=None):
+        self.matcher = SavedSearchMatcher(
+            searches if searches is not None else self.db.get_saved_searches()
+        )
+        self.loaded_at = time.monotonic()
+
+    def refresh(self, force=False):
+        """
+        Reload saved searches from the database if they are stale
+
+        Returns:
+            True if the matcher was rebuilt
+        """
+        if self._static:
+            return False
+        if not force and time.monotonic() - self.loaded_at < self.refresh_interval:
+            return False
+        self._load()
+        return True
+
+    def route(self, job):
+        """
+        Notify once per job on every channel a matching search asked for
+
+        Returns:
+            Dict of channel -> success, empty when nothing matched
+        """
+        users = set()
+        channels = set()
+        for search in self.matcher.match(job):
+            users.add(search['user'])
+            channels.update(search['channels'])
+
+        if not channels:
+            return {}
+
+        logger.info(f"Alert match for {', '.join(sorted(users))}: {job['title']}")
+        results = Notifier.notify(job, channels=sorted(channels))
+
+        for channel, success in results.items():
+            if success and job.get('id'):
+                self.db.record_notification(job['id'], channel)
+
+        return results
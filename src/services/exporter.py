@@ -0,0 +1,139 @@
+# src/services/exporter.py
+import csv
+import io
+import json
+
+EXPORT_FORMATS = ('ndjson', 'csv', 'parquet')
+
+MEDIA_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+EXPORT_FIELDS = [
+    'id', 'source_id', 'external_id', 'title', 'company', 'location',
+    'description', 'job_type', 'experience_level', 'salary_min', 'salary_max',
+    'salary_currency', 'url', 'posted_date', 'scrapped_at', 'is_active',
+    'content_hash'
+]
+
+def parquet_available():
+    """Check whether pyarrow is installed for Parquet export"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def iter_ndjson(batches):
+    """Encode job batches as newline-delimited JSON, one chunk per batch"""
+    for batch in batches:
+        lines = [
+            json.dumps({field: job.get(field) for field in EXPORT_FIELDS}, default=str)
+            for job in batch
+        ]
+        yield ('\n'.join(lines) + '\n').encode('utf-8')
+
+def iter_csv(batches):
+    """Encode job batches as CSV with a header row, one chunk per batch"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, extrasaction='ignore')
+    writer.writeheader()
+
+    for batch in batches:
+        writer.writerows(batch)
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+
+    # Header-only output when nothing matched
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only stream that hands written bytes back in chunks
+
+    ParquetWriter records column chunk offsets via tell(), so the position
+    keeps counting even though drained bytes are released.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+def iter_parquet(batches):
+    """Encode job batches as Parquet, writing one row group per batch"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ('id', pa.int64()),
+        ('source_id', pa.int64()),
+        ('external_id', pa.string()),
+        ('title', pa.string()),
+        ('company', pa.string()),
+        ('location', pa.string()),
+        ('description', pa.string()),
+        ('job_type', pa.string()),
+        ('experience_level', pa.string()),
+        ('salary_min', pa.float64()),
+        ('salary_max', pa.float64()),
+        ('salary_currency', pa.string()),
+        ('url', pa.string()),
+        ('posted_date', pa.string()),
+        ('scrapped_at', pa.string()),
+        ('is_active', pa.int64()),
+        ('content_hash', pa.string()),
+    ])
+
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        for batch in batches:
+            columns = {field: [job.get(field) for job in batch] for field in EXPORT_FIELDS}
+            for field in ('external_id', 'posted_date', 'scrapped_at'):
+                columns[field] = [None if v is None else str(v) for v in columns[field]]
+            writer.write_table(pa.table(columns, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+
+    yield sink.drain()
+
+def iter_export(batches, fmt):
+    """
+    Stream job batches in the requested format
+
+    Args:
+        batches: Iterable of job dictionary lists (see Database.iter_job_batches)
+        fmt: One of EXPORT_FORMATS
+
+    Returns:
+        Generator of encoded byte chunks
+    """
+    if fmt == 'ndjson':
+        return iter_ndjson(batches)
+    if fmt == 'csv':
+        return iter_csv(batches)
+    if fmt == 'parquet':
+        if not parquet_available():
+            raise RuntimeError("Parquet export requires pyarrow to be installed")
+        return iter_parquet(batches)
+    raise ValueError(f"Unsupported export format: {fmt}")
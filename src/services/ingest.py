@@ -0,0 +1,53 @@
+# src/services/ingest.py
+from src.services.deduplicator import generate_content_hash
+from src.services.notifier import Notifier
+from src.services.scoring import compute_features
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+def ensure_source(db, name, base_url):
+    """Get a source's id, registering it on first use"""
+    source = db.get_source_by_name(name)
+    if not source:
+        db.insert_source(name, base_url)
+        source = db.get_source_by_name(name)
+    return source['id']
+
+def notify_new_job(db, job, alerts=None):
+    """Route a newly inserted job to saved-search alerts, or notify on every job"""
+    if alerts and alerts.matcher.size:
+        return alerts.route(job)
+
+    notification_results = Notifier.notify(job)
+
+    # Record notifications
+    for channel, success in notification_results.items():
+        if success:
+            db.record_notification(job['id'], channel)
+    return notification_results
+
+def ingest_jobs(db, jobs, source_id, alerts=None):
+    """
+    Bulk ingest path: hash and score, insert in one transaction, then notify
+
+    Deduplication is by content hash and (source_id, external_id), both
+    checked inside the insert transaction, so concurrent workers and retried
+    tasks never store a job twice. Fuzzy matching is left to the
+    single-process scraper.
+
+    Returns:
+        List of newly inserted jobs
+    """
+    for job in jobs:
+        job['source_id'] = source_id
+        job['content_hash'] = generate_content_hash(job)
+        job['features'] = compute_features(job)
+
+    new_jobs = db.insert_jobs(jobs)
+
+    for job in new_jobs:
+        logger.info(f"New job found: {job['title']} at {job['company']}")
+        notify_new_job(db, job, alerts)
+
+    return new_jobs
@@ -0,0 +1,150 @@
+# src/services/scoring.py
+import math
+import re
+import struct
+from datetime import datetime, timezone
+from config.settings import settings
+from src.utils.text import tokenize
+
+# Per-job feature vector, packed as little-endian float32 into job_features.
+# Unknown salary / posted date are stored as NaN.
+FEATURES = (
+    'title_keywords',        # settings.KEYWORDS found in the title
+    'description_keywords',  # settings.KEYWORDS found in company/description
+    'seniority',             # +1 matches EXPERIENCE_LEVEL, -1 conflicts, 0 unknown
+    'salary',                # salary_max, else salary_min
+    'location',              # 1 if the location matches settings.LOCATIONS
+    'posted_day',            # posted date as days since the Unix epoch
+)
+FEATURE_FORMAT = '<' + 'f' * len(FEATURES)
+FEATURE_SIZE = struct.calcsize(FEATURE_FORMAT)
+
+SENIORITY_TERMS = {
+    'junior': {'junior', 'jr', 'entry', 'graduate', 'associate', 'intern', 'internship'},
+    'mid': {'mid', 'intermediate'},
+    'senior': {'senior', 'sr', 'lead', 'principal', 'staff'},
+}
+
+_SQUASH_RE = re.compile(r'[^a-z0-9]+')
+
+def _squash(text):
+    # 'New York, NY' -> 'newyorkny', so it matches LOCATIONS like 'newyork'
+    return _SQUASH_RE.sub('', (text or '').lower())
+
+def _keyword_hits(tokens, keywords):
+    hits = 0
+    for keyword in keywords:
+        phrase = tokenize(keyword)
+        if phrase and tokens.issuperset(phrase):
+            hits += 1
+    return hits
+
+def _seniority(tokens, target):
+    target_terms = SENIORITY_TERMS.get(target, {target})
+    if tokens & target_terms:
+        return 1.0
+    for level, terms in SENIORITY_TERMS.items():
+        if level != target and tokens & terms:
+            return -1.0
+    return 0.0
+
+def _posted_day(posted_date):
+    if not posted_date:
+        return math.nan
+    try:
+        posted = datetime.fromisoformat(str(posted_date).replace('Z', '+00:00'))
+    except ValueError:
+        return math.nan
+    if posted.tzinfo is None:
+        posted = posted.replace(tzinfo=timezone.utc)
+    return posted.timestamp() / 86400
+
+def compute_features(job):
+    """
+    Build the packed feature vector for a job
+
+    This runs at ingest, in pure Python, so the scraper never has to
+    import NumPy. Run `cli.py rescore` after changing KEYWORDS,
+    EXPERIENCE_LEVEL or LOCATIONS.
+
+    Returns:
+        FEATURE_SIZE bytes for the job_features table
+    """
+    title_tokens = set(tokenize(job.get('title')))
+    title_tokens.update(tokenize(job.get('experience_level')))
+    body_tokens = set(tokenize(job.get('company')))
+    body_tokens.update(tokenize(job.get('description')))
+
+    salary = job.get('salary_max') or job.get('salary_min')
+    location = _squash(job.get('location')) + _squash(job.get('title'))
+
+    return struct.pack(
+        FEATURE_FORMAT,
+        _keyword_hits(title_tokens, settings.KEYWORDS),
+        _keyword_hits(body_tokens, settings.KEYWORDS),
+        _seniority(title_tokens, (settings.EXPERIENCE_LEVEL or '').lower()),
+        float(salary) if salary else math.nan,
+        1.0 if any(_squash(place) in location for place in settings.LOCATIONS) else 0.0,
+        _posted_day(job.get('posted_date'))
+    )
+
+def score_features(matrix, weights=None, now=None):
+    """
+    Score an (n_jobs, len(FEATURES)) float32 matrix in one vectorized pass
+
+    Returns:
+        NumPy array of n_jobs scores
+    """
+    import numpy as np
+
+    weights = {**settings.SCORING_WEIGHTS, **(weights or {})}
+    now_day = (now or datetime.now(timezone.utc)).timestamp() / 86400
+
+    title, description, seniority, salary, location, posted_day = matrix.T
+
+    salary_score = np.clip(np.nan_to_num(salary / settings.SCORING_SALARY_REFERENCE), 0, 2)
+    age_days = np.maximum(now_day - posted_day, 0)
+    recency = np.nan_to_num(np.exp2(-age_days / settings.SCORING_RECENCY_HALF_LIFE_DAYS))
+
+    return (
+        weights['title_keywords'] * title
+        + weights['description_keywords'] * np.log1p(description)
+        + weights['seniority'] * seniority
+        + weights['salary'] * salary_score
+        + weights['location'] * location
+        + weights['recency'] * recency
+    )
+
+def rank_jobs(source, keyword=None, location=None, limit=50, weights=None):
+    """
+    Top-k jobs by relevance among those matching the filters
+
+    Args:
+        source: Database or SnapshotReader (needs candidate_features and get_jobs_by_ids)
+
+    Returns:
+        Job dictionaries with a 'score' key, best first
+    """
+    import numpy as np
+
+    ids, packed = source.candidate_features(keyword=keyword, location=location)
+    if not ids:
+        return []
+
+    id_array = np.fromstring(ids, dtype=np.int64, sep=',')
+    matrix = np.frombuffer(packed, dtype='<f4').reshape(len(id_array), len(FEATURES))
+    scores = score_features(matrix, weights)
+
+    k = min(limit, len(id_array))
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top], kind='stable')]
+
+    jobs = {job['id']: job for job in source.get_jobs_by_ids(id_array[top].tolist())}
+
+    ranked = []
+    for index in top:
+        job = jobs.get(int(id_array[index]))
+        if job:
+            job['score'] = round(float(scores[index]), 4)
+            ranked.append(job)
+    return ranked
@@ -0,0 +1,332 @@
+# src/services/snapshot.py
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from config.settings import settings
+from src.models.database import CANDIDATE_FEATURES_QUERY
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+POINTER = 'CURRENT'
+
+# Trigram FTS keeps LIKE '%term%' semantics (case-insensitive substring)
+# while answering from an index; terms under 3 characters fall back to LIKE.
+FTS_MIN_TERM = 3
+
+def _snapshot_dir(snapshot_dir=None):
+    return snapshot_dir or settings.SNAPSHOT_DIR
+
+def list_snapshots(snapshot_dir=None):
+    """Snapshot file names, oldest first"""
+    snapshot_dir = _snapshot_dir(snapshot_dir)
+    if not os.path.isdir(snapshot_dir):
+        return []
+    return sorted(
+        name for name in os.listdir(snapshot_dir)
+        if name.startswith('jobs-') and name.endswith('.db')
+    )
+
+def current_snapshot(snapshot_dir=None):
+    """Path of the published snapshot, or None if nothing is published"""
+    snapshot_dir = _snapshot_dir(snapshot_dir)
+    try:
+        with open(os.path.join(snapshot_dir, POINTER)) as f:
+            name = f.read().strip()
+    except FileNotFoundError:
+        return None
+    return os.path.join(snapshot_dir, name) if name else None
+
+def _point_to(snapshot_dir, name):
+    # Write-then-rename so readers only ever see the old or the new pointer
+    tmp = os.path.join(snapshot_dir, POINTER + '.tmp')
+    with open(tmp, 'w') as f:
+        f.write(name)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, os.path.join(snapshot_dir, POINTER))
+
+def _build_read_indexes(conn):
+    conn.executescript('''
+        CREATE VIRTUAL TABLE jobs_fts USING fts5(
+            title, company, description, location,
+            content='jobs', content_rowid='id', tokenize='trigram'
+        );
+        INSERT INTO jobs_fts(jobs_fts) VALUES('rebuild');
+    ''')
+
+def _build_stats(conn, published_at):
+    conn.executescript('''
+        CREATE TABLE snapshot_stats (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    ''')
+    total_jobs = conn.execute('SELECT COUNT(*) FROM jobs WHERE is_active = 1').fetchone()[0]
+    total_apps = conn.execute('SELECT COUNT(*) FROM applications').fetchone()[0]
+    conn.executemany(
+        'INSERT INTO snapshot_stats (key, value) VALUES (?, ?)',
+        [
+            ('total_jobs', total_jobs),
+            ('total_applications', total_apps),
+            ('published_at', published_at),
+        ]
+    )
+
+def publish_snapshot(db, snapshot_dir=None, keep=None):
+    """
+    Copy the writer database into a read-optimized snapshot and publish it
+
+    The copy is taken with the SQLite online backup API, so ingest does not
+    have to stop. FTS and stats are built on the copy, and then the CURRENT
+    pointer is swapped atomically. Only the newest `keep` snapshots are kept
+    (the published one is never deleted), which leaves older ones available
+    for rollback_snapshot().
+
+    Returns:
+        Path of the published snapshot
+    """
+    snapshot_dir = _snapshot_dir(snapshot_dir)
+    keep = settings.SNAPSHOT_KEEP if keep is None else keep
+    if keep < 1:
+        # [:-0] would prune nothing, and the published snapshot is always kept
+        raise ValueError(f"Snapshots to keep must be at least 1, got {keep}")
+    os.makedirs(snapshot_dir, exist_ok=True)
+
+    now = datetime.now(timezone.utc)
+    name = f"jobs-{now.strftime('%Y%m%dT%H%M%S%fZ')}.db"
+    path = os.path.join(snapshot_dir, name)
+    tmp = path + '.tmp'
+
+    with db.get_connection() as source:
+        target = sqlite3.connect(tmp)
+        try:
+            source.backup(target)
+            target.execute('PRAGMA journal_mode = DELETE')
+            try:
+                _build_read_indexes(target)
+            except sqlite3.OperationalError as e:
+                # SQLite without FTS5/trigram: readers fall back to LIKE
+                logger.warning(f"Snapshot built without FTS index: {e}")
+            _build_stats(target, now.isoformat())
+            target.execute('ANALYZE')
+            target.commit()
+        finally:
+            target.close()
+
+    os.replace(tmp, path)
+    _point_to(snapshot_dir, name)
+    logger.info(f"Published snapshot {name}")
+
+    _prune(snapshot_dir, keep, name)
+    return path
+
+def rollback_snapshot(snapshot_dir=None):
+    """
+    Re-publish the snapshot before the current one
+
+    Returns:
+        Path of the now-current snapshot, or None if there is nothing older
+    """
+    snapshot_dir = _snapshot_dir(snapshot_dir)
+    snapshots = list_snapshots(snapshot_dir)
+    current = current_snapshot(snapshot_dir)
+    current_name = os.path.basename(current) if current else None
+
+    if current_name not in snapshots:
+        return None
+
+    index = snapshots.index(current_name)
+    if index == 0:
+        return None
+
+    previous = snapshots[index - 1]
+    _point_to(snapshot_dir, previous)
+    logger.info(f"Rolled back snapshot {current_name} -> {previous}")
+    return os.path.join(snapshot_dir, previous)
+
+def _prune(snapshot_dir, keep, current_name):
+    for name in list_snapshots(snapshot_dir)[:-keep]:
+        if name == current_name:
+            continue
+        try:
+            os.remove(os.path.join(snapshot_dir, name))
+        except OSError as e:
+            # Still open by a reader on platforms that lock open files
+            logger.warning(f"Could not prune snapshot {name}: {e}")
+
+class SnapshotReader:
+    """
+    Read-only job queries against the published snapshot
+
+    Each thread keeps its own read-only, immutable, mmap-backed connection.
+    Snapshots are never written after publishing, so reads take no locks
+    and cannot stall behind ingest transactions. The CURRENT pointer is
+    checked with one stat() per query, and connections reopen on the new
+    file after a publish or rollback.
+
+    Until the first snapshot is published, queries go to the fallback
+    Database.
+    """
+
+    def __init__(self, fallback, snapshot_dir=None):
+        self.fallback = fallback
+        self.snapshot_dir = _snapshot_dir(snapshot_dir)
+        self._pointer = os.path.join(self.snapshot_dir, POINTER)
+        self._pointer_version = None
+        self._path = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _current_path(self):
+        try:
+            stat = os.stat(self._pointer)
+        except FileNotFoundError:
+            return None
+
+        # os.replace() gives the pointer a new inode on every swap
+        version = (stat.st_ino, stat.st_mtime_ns)
+        if version != self._pointer_version:
+            with self._lock:
+                self._path = current_snapshot(self.snapshot_dir)
+                self._pointer_version = version
+        return self._path
+
+    def _open(self, path, check_same_thread=True):
+        uri = f"file:{os.path.abspath(path)}?mode=ro&immutable=1"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=check_same_thread)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f'PRAGMA mmap_size = {int(settings.SNAPSHOT_MMAP_SIZE)}')
+        return conn
+
+    def _connection(self):
+        path = self._current_path()
+        if path is None:
+            return None, False
+
+        local = self._local
+        if getattr(local, 'path', None) != path:
+            if getattr(local, 'conn', None) is not None:
+                local.conn.close()
+            local.conn = self._open(path)
+            local.path = path
+            local.has_fts = self._has_fts(local.conn)
+            local.has_features = self._has_table(local.conn, 'job_features')
+        return local.conn, local.has_fts
+
+    @staticmethod
+    def _has_table(conn, name):
+        row = conn.execute(
+            'SELECT 1 FROM sqlite_master WHERE name = ?', (name,)
+        ).fetchone()
+        return row is not None
+
+    @classmethod
+    def _has_fts(cls, conn):
+        return cls._has_table(conn, 'jobs_fts')
+
+    def supports_ranking(self):
+        """False when the current snapshot predates job_features"""
+        conn, _ = self._connection()
+        return conn is None or self._local.has_features
+
+    @staticmethod
+    def _fts_phrase(term):
+        return '"' + term.replace('"', '""') + '"'
+
+    def _job_filters(self, keyword=None, location=None, has_fts=False, columns='*', joins=''):
+        query = f'SELECT {columns} FROM jobs {joins} WHERE is_active = 1'
+        parms = []
+        fts_terms = []
+
+        if keyword:
+            if has_fts and len(keyword) >= FTS_MIN_TERM:
+                fts_terms.append('{title company description}: ' + self._fts_phrase(keyword))
+            else:
+                query += ' AND (title LIKE ? or description LIKE ? OR company LIKE ?)'
+                search_term = f'%{keyword}%'
+                parms.extend([search_term, search_term, search_term])
+
+        if location:
+            if has_fts and len(location) >= FTS_MIN_TERM:
+                fts_terms.append('{location}: ' + self._fts_phrase(location))
+            else:
+                query += ' AND location LIKE ?'
+                parms.append(f'%{location}%')
+
+        if fts_terms:
+            query += ' AND id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)'
+            parms.append(' AND '.join(fts_terms))
+
+        return query, parms
+
+    def query_jobs(self, keyword=None, location=None, limit=50):
+        conn, has_fts = self._connection()
+        if conn is None:
+            return self.fallback.query_jobs(keyword=keyword, location=location, limit=limit)
+
+        query, parms = self._job_filters(keyword, location, has_fts)
+        query += ' LIMIT ?'
+        parms.append(limit)
+        return [dict(row) for row in conn.execute(query, parms).fetchall()]
+
+    def iter_job_batches(self, keyword=None, location=None, batch_size=1000):
+        path = self._current_path()
+        if path is None:
+            yield from self.fallback.iter_job_batches(keyword, location, batch_size)
+            return
+
+        # Own connection: streaming may resume on another worker thread
+        conn = self._open(path, check_same_thread=False)
+        try:
+            query, parms = self._job_filters(keyword, location, self._has_fts(conn))
+            cursor = conn.execute(query + ' ORDER BY id', parms)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [dict(row) for row in rows]
+        finally:
+            conn.close()
+
+    def get_job(self, job_id):
+        conn, _ = self._connection()
+        if conn is None:
+            return self.fallback.get_job(job_id)
+
+        row = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def candidate_features(self, keyword=None, location=None):
+        conn, has_fts = self._connection()
+        if conn is None:
+            return self.fallback.candidate_features(keyword=keyword, location=location)
+
+        if not self._local.has_features:
+            return '', b''
+
+        query, parms = self._job_filters(keyword, location, has_fts, **CANDIDATE_FEATURES_QUERY)
+        ids, packed = conn.execute(query, parms).fetchone()
+        return ids or '', packed or b''
+
+    def get_jobs_by_ids(self, job_ids):
+        conn, _ = self._connection()
+        if conn is None:
+            return self.fallback.get_jobs_by_ids(job_ids)
+
+        placeholders = ','.join('?' * len(job_ids))
+        rows = conn.execute(
+            f'SELECT * FROM jobs WHERE id IN ({placeholders})',
+            list(job_ids)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_stats(self):
+        """Precomputed snapshot stats, or None before the first publish"""
+        conn, _ = self._connection()
+        if conn is None:
+            return None
+
+        rows = conn.execute('SELECT key, value FROM snapshot_stats').fetchall()
+        return {row['key']: row['value'] for row in rows}
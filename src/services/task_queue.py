@@ -0,0 +1,197 @@
+# src/services/task_queue.py
+import time
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from config.settings import settings
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+class TaskQueue(ABC):
+    """
+    Leased work queue of (source, keyword, location, page) scrape tasks
+
+    A worker claims a task with a lease and renews it with heartbeat()
+    while working. Expired leases go back to other workers, so a worker
+    that dies mid-task delays that task but does not lose it.
+    complete() and fail() only succeed for the current lease owner, so a
+    worker that lost its lease cannot overwrite the result. After
+    max_attempts claims, a task is marked failed.
+    """
+
+    def __init__(self, max_attempts=None, lease_seconds=None):
+        self.max_attempts = max_attempts or settings.MAX_RETRIES
+        self.lease_seconds = lease_seconds or settings.QUEUE_LEASE_SECONDS
+
+    @abstractmethod
+    def enqueue(self, run_id, tasks):
+        #Add task dicts (source, keyword, location, page); returns number added
+        pass
+
+    @abstractmethod
+    def claim(self, worker_id):
+        #Lease the next available task, or return None
+        pass
+
+    @abstractmethod
+    def heartbeat(self, task_id, worker_id):
+        #Extend a lease; False if the worker no longer holds it
+        pass
+
+    @abstractmethod
+    def complete(self, task_id, worker_id, result_count=0):
+        #Mark a leased task done; False if the lease was lost
+        pass
+
+    @abstractmethod
+    def fail(self, task_id, worker_id, error):
+        #Release a task for retry, or fail it for good after max_attempts
+        pass
+
+    @abstractmethod
+    def stats(self, run_id=None):
+        #Task counts by status
+        pass
+
+    def outstanding(self, run_id=None):
+        """Tasks not yet done or failed"""
+        counts = self.stats(run_id)
+        return counts.get('pending', 0) + counts.get('leased', 0)
+
+class SQLiteTaskQueue(TaskQueue):
+    """
+    TaskQueue stored in the jobs database's tasks table
+
+    Each claim is a single UPDATE ... RETURNING inside BEGIN IMMEDIATE, so
+    two workers can never lease the same task. Workers on other machines
+    need the database on shared storage; for anything larger, register
+    another backend in QUEUE_BACKENDS.
+    """
+
+    def __init__(self, db, **kwargs):
+        super().__init__(**kwargs)
+        self.db = db
+
+    def enqueue(self, run_id, tasks):
+        with self.db.get_connection() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                '''INSERT OR IGNORE INTO tasks (run_id, source, keyword, location, page)
+                   VALUES (?, ?, ?, ?, ?)''',
+                [
+                    (run_id, task['source'], task['keyword'], task.get('location') or '', task.get('page', 1))
+                    for task in tasks
+                ]
+            )
+            return conn.total_changes - before
+
+    def claim(self, worker_id):
+        now = time.time()
+
+        with self.db.get_connection() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+
+            # Leases that expired on their last allowed attempt are given up
+            conn.execute(
+                '''UPDATE tasks
+                   SET status = 'failed', error = 'lease expired', lease_owner = NULL,
+                       finished_at = CURRENT_TIMESTAMP
+                   WHERE status = 'leased' AND lease_expires_at < ? AND attempts >= ?''',
+                (now, self.max_attempts)
+            )
+
+            rows = conn.execute(
+                '''UPDATE tasks
+                   SET status = 'leased', attempts = attempts + 1,
+                       lease_owner = ?, lease_expires_at = ?
+                   WHERE id = (
+                       SELECT id FROM tasks
+                       WHERE status = 'pending'
+                          OR (status = 'leased' AND lease_expires_at < ?)
+                       ORDER BY id
+                       LIMIT 1
+                   )
+                   RETURNING *''',
+                (worker_id, now + self.lease_seconds, now)
+            ).fetchall()
+
+        return dict(rows[0]) if rows else None
+
+    def heartbeat(self, task_id, worker_id):
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(
+                '''UPDATE tasks SET lease_expires_at = ?
+                   WHERE id = ? AND lease_owner = ? AND status = 'leased' ''',
+                (time.time() + self.lease_seconds, task_id, worker_id)
+            )
+            return cursor.rowcount > 0
+
+    def complete(self, task_id, worker_id, result_count=0):
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(
+                '''UPDATE tasks
+                   SET status = 'done', result_count = ?, lease_owner = NULL,
+                       lease_expires_at = NULL, error = NULL, finished_at = CURRENT_TIMESTAMP
+                   WHERE id = ? AND lease_owner = ? AND status = 'leased' ''',
+                (result_count, task_id, worker_id)
+            )
+            return cursor.rowcount > 0
+
+    def fail(self, task_id, worker_id, error):
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(
+                '''UPDATE tasks
+                   SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                       finished_at = CASE WHEN attempts >= ? THEN CURRENT_TIMESTAMP END,
+                       lease_owner = NULL, lease_expires_at = NULL, error = ?
+                   WHERE id = ? AND lease_owner = ? AND status = 'leased' ''',
+                (self.max_attempts, self.max_attempts, str(error), task_id, worker_id)
+            )
+            return cursor.rowcount > 0
+
+    def stats(self, run_id=None):
+        query = 'SELECT status, COUNT(*) AS count FROM tasks'
+        parms = []
+
+        if run_id:
+            query += ' WHERE run_id = ?'
+            parms.append(run_id)
+
+        query += ' GROUP BY status'
+
+        with self.db.get_connection() as conn:
+            rows = conn.execute(query, parms).fetchall()
+            return {row['status']: row['count'] for row in rows}
+
+QUEUE_BACKENDS = {
+    'sqlite': SQLiteTaskQueue,
+}
+
+def get_queue(db, backend=None, **kwargs):
+    """Build the configured TaskQueue backend"""
+    backend = backend or settings.QUEUE_BACKEND
+    if backend not in QUEUE_BACKENDS:
+        raise ValueError(f"Unknown queue backend: {backend}")
+    return QUEUE_BACKENDS[backend](db, **kwargs)
+
+def new_run_id():
+    return datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S') + '-' + uuid.uuid4().hex[:8]
+
+def enqueue_run(queue, sources, keywords, location='', pages=1, run_id=None):
+    """
+    Enqueue one task per source x keyword x page
+
+    Returns:
+        (run_id, number of tasks added)
+    """
+    run_id = run_id or new_run_id()
+    tasks = [
+        {'source': source, 'keyword': keyword, 'location': location, 'page': page}
+        for source in sources
+        for keyword in keywords
+        for page in range(1, pages + 1)
+    ]
+    added = queue.enqueue(run_id, tasks)
+    logger.info(f"Enqueued {added} tasks for run {run_id}")
+    return run_id, added
@@ -0,0 +1,122 @@
+# src/services/worker.py
+import os
+import socket
+import threading
+import time
+from config.settings import settings
+from src.fetchers.adzuna import AdzunaFetcher
+from src.services.alerts import AlertRouter
+from src.services.ingest import ensure_source, ingest_jobs
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# source name -> (fetcher factory, base_url registered in sources)
+FETCHERS = {
+    'adzuna': (AdzunaFetcher, AdzunaFetcher.BASE_URL),
+}
+
+def register_fetcher(name, factory, base_url):
+    """Make a fetcher available to workers under a source name"""
+    FETCHERS[name] = (factory, base_url)
+
+def default_worker_id():
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+class Worker:
+    """
+    Claim scrape tasks from a TaskQueue and ingest their results
+
+    While a task is being fetched, a heartbeat thread renews the lease every
+    third of the lease period. Results go through ingest_jobs in one
+    transaction per task, so a task that is retried after a lost lease
+    does not create duplicate jobs. Saved searches for alerts are reloaded
+    every ALERTS_REFRESH_INTERVAL seconds.
+    """
+
+    def __init__(self, queue, db, worker_id=None, poll_interval=None):
+        self.queue = queue
+        self.db = db
+        self.worker_id = worker_id or default_worker_id()
+        self.poll_interval = settings.QUEUE_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.alerts = AlertRouter(db)
+        self._fetchers = {}
+        self._source_ids = {}
+
+    def _fetcher(self, source):
+        if source not in self._fetchers:
+            if source not in FETCHERS:
+                raise ValueError(f"No fetcher registered for source: {source}")
+            factory, base_url = FETCHERS[source]
+            self._fetchers[source] = factory()
+            self._source_ids[source] = ensure_source(self.db, source, base_url)
+        return self._fetchers[source]
+
+    def _heartbeat(self, task, stop):
+        interval = self.queue.lease_seconds / 3
+        while not stop.wait(interval):
+            if not self.queue.heartbeat(task['id'], self.worker_id):
+                logger.warning(f"{self.worker_id} lost lease on task {task['id']}")
+                return
+
+    def process(self, task):
+        """
+        Run one claimed task
+
+        Returns:
+            True if the task was completed under this worker's lease
+        """
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(task, stop), daemon=True)
+        heartbeat.start()
+
+        try:
+            self.alerts.refresh()
+            fetcher = self._fetcher(task['source'])
+            # Fetch errors must reach queue.fail() so the page is retried
+            if task['location']:
+                jobs = fetcher.fetch_jobs(task['keyword'], task['location'], page=task['page'], raise_errors=True)
+            else:
+                jobs = fetcher.fetch_jobs(task['keyword'], page=task['page'], raise_errors=True)
+            new_jobs = ingest_jobs(self.db, jobs, self._source_ids[task['source']], self.alerts)
+        except Exception as e:
+            logger.exception(f"Task {task['id']} failed: {e}")
+            self.queue.fail(task['id'], self.worker_id, e)
+            return False
+        finally:
+            stop.set()
+            heartbeat.join()
+
+        return self.queue.complete(task['id'], self.worker_id, len(new_jobs))
+
+    def run(self, exit_when_idle=True, max_tasks=None):
+        """
+        Process tasks until the queue is drained (or forever)
+
+        Returns:
+            Number of tasks completed by this worker
+        """
+        logger.info(f"Worker {self.worker_id} started")
+        completed = 0
+
+        try:
+            while max_tasks is None or completed < max_tasks:
+                task = self.queue.claim(self.worker_id)
+
+                if task is None:
+                    # Leased tasks may still come back if their worker died
+                    if exit_when_idle and not self.queue.outstanding():
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+
+                if self.process(task):
+                    completed += 1
+        finally:
+            # Fetchers are reused across tasks (one browser pool per source)
+            for fetcher in self._fetchers.values():
+                fetcher.close()
+            self._fetchers.clear()
+
+        logger.info(f"Worker {self.worker_id} finished: {completed} tasks")
+        return completed
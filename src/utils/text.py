@@ -0,0 +1,8 @@
+# src/utils/text.py
+import re
+
+TOKEN_RE = re.compile(r'[a-z0-9+#]+')
+
+def tokenize(text):
+    """Lowercase word tokens, keeping terms like c++ and c#"""
+    return TOKEN_RE.findall((text or '').lower())
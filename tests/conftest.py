@@ -0,0 +1,4 @@
+# tests/conftest.py
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -0,0 +1,252 @@
+# tests/test_html_fetcher.py
+import asyncio
+import os
+import threading
+import urllib.request
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+from bs4 import BeautifulSoup
+
+from src.fetchers import html
+from src.fetchers.html import PARSER, BrowserPool, CareerPageFetcher
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+SELECTORS = {
+    'job': 'li.opening',
+    'title': 'h3',
+    'location': '.location',
+    'description': '.summary',
+    'link': 'a',
+    'id': 'data-job-id',
+}
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture(scope='module')
+def server():
+    """Serve tests/fixtures on a free local port"""
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), partial(QuietHandler, directory=FIXTURES))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+def make_fetcher(base_url, pages=2, page_name='careers_{page}.html', **kwargs):
+    return CareerPageFetcher(
+        'acme',
+        base_url + '/' + page_name + '?q={keyword}&where={location}',
+        selectors=SELECTORS,
+        company='Acme',
+        pages=pages,
+        **kwargs
+    )
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+def external_ids(jobs):
+    return [job['external_id'] for job in jobs]
+
+def test_parse_jobs():
+    fetcher = make_fetcher('http://acme.test')
+    soup = BeautifulSoup(read_fixture('careers_1.html'), PARSER)
+
+    jobs = fetcher.parse_jobs(soup, 'http://acme.test/careers_1.html')
+
+    # The listing with a blank title is skipped
+    assert external_ids(jobs) == ['acme-101', 'acme-102']
+    assert jobs[0]['title'] == 'Senior Python Developer'
+    assert jobs[0]['company'] == 'Acme'
+    assert jobs[0]['location'] == 'Remote'
+    assert jobs[0]['description'] == 'Build data pipelines in Python.'
+
+def test_parse_jobs_joins_relative_urls():
+    fetcher = make_fetcher('http://acme.test')
+    soup = BeautifulSoup(read_fixture('careers_1.html'), PARSER)
+
+    jobs = fetcher.parse_jobs(soup, 'http://acme.test/careers/list.html')
+
+    assert jobs[0]['url'] == 'http://acme.test/careers/jobs/101'
+    assert jobs[1]['url'] == 'http://acme.test/careers/jobs/102?ref=list'
+
+def test_parse_jobs_falls_back_to_url_for_external_id():
+    selectors = {key: value for key, value in SELECTORS.items() if key != 'id'}
+    fetcher = CareerPageFetcher('acme', 'http://acme.test/{page}', selectors=selectors)
+    soup = BeautifulSoup(read_fixture('careers_2.html'), PARSER)
+
+    jobs = fetcher.parse_jobs(soup, 'http://acme.test/careers_2.html')
+
+    assert jobs[0]['external_id'] == 'https://jobs.example.org/acme/201'
+    assert jobs[0]['url'] == 'https://jobs.example.org/acme/201'
+
+def test_fetch_all_pages(server):
+    with make_fetcher(server) as fetcher:
+        jobs = fetcher.fetch_all_pages('python developer', 'remote')
+
+    assert external_ids(jobs) == ['acme-101', 'acme-102', 'acme-201']
+    assert jobs[0]['url'] == f"{server}/careers/jobs/101"
+    assert jobs[1]['url'] == f"{server}/jobs/102?ref=list"
+
+def test_fetch_jobs_single_page(server):
+    with make_fetcher(server) as fetcher:
+        # Same contract as BaseFetcher: one page per call, page 1 by default
+        assert external_ids(fetcher.fetch_jobs('python')) == ['acme-101', 'acme-102']
+        assert external_ids(fetcher.fetch_jobs('python', page=2)) == ['acme-201']
+        assert fetcher.fetch_jobs('python', page=5) == []
+
+def test_fetch_jobs_reuses_session(server):
+    with make_fetcher(server) as fetcher:
+        fetcher.fetch_jobs('python', page=1)
+        session = fetcher._session
+        fetcher.fetch_jobs('python', page=2)
+        assert fetcher._session is session
+
+    assert fetcher._session is None
+
+def test_fetch_jobs_skips_missing_pages(server):
+    # careers_3.html does not exist, so the server answers 404
+    with make_fetcher(server, pages=3) as fetcher:
+        assert fetcher.fetch_jobs('python', page=3) == []
+        assert len(fetcher.fetch_all_pages('python')) == 3
+
+def test_fetch_jobs_raise_errors(server):
+    with make_fetcher(server, pages=3) as fetcher:
+        with pytest.raises(requests.HTTPError):
+            fetcher.fetch_jobs('python', page=3, raise_errors=True)
+        assert len(fetcher.fetch_jobs('python', page=1, raise_errors=True)) == 2
+
+@pytest.mark.parametrize('resource_type, url, blocked', [
+    ('image', 'https://acme.test/logo.png', True),
+    ('font', 'https://acme.test/font.woff2', True),
+    ('document', 'https://acme.test/careers', False),
+    ('script', 'https://www.google-analytics.com/analytics.js', True),
+    ('script', 'https://google-analytics.com/analytics.js', True),
+    ('script', 'https://notgoogle-analytics.com/analytics.js', False),
+    ('xhr', 'https://acme.test/api/jobs', False),
+])
+def test_browser_pool_is_blocked(resource_type, url, blocked):
+    pool = BrowserPool(size=1, blocked_resource_types=['image', 'font', 'media'],
+                       blocked_domains=['google-analytics.com'])
+
+    assert pool.is_blocked(resource_type, url) is blocked
+
+def test_browser_pool_uses_settings_defaults():
+    pool = BrowserPool(size=1)
+
+    assert pool.is_blocked('image', 'https://acme.test/logo.png')
+    assert not pool.is_blocked('document', 'https://acme.test/careers')
+
+class FakeRoute:
+    def __init__(self, resource_type, url):
+        self.request = type('Request', (), {'resource_type': resource_type, 'url': url})()
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = 'aborted'
+
+    async def continue_(self):
+        self.outcome = 'continued'
+
+def test_browser_pool_route_aborts_blocked_requests():
+    pool = BrowserPool(size=1)
+    routes = [
+        FakeRoute('image', 'https://acme.test/logo.png'),
+        FakeRoute('script', 'https://www.google-analytics.com/analytics.js'),
+        FakeRoute('document', 'https://acme.test/careers'),
+    ]
+
+    async def run():
+        for route in routes:
+            await pool._route(route)
+
+    asyncio.run(run())
+
+    assert [route.outcome for route in routes] == ['aborted', 'aborted', 'continued']
+    assert pool.aborted == {'image': 1, 'script': 1}
+
+class FakeBrowserPool:
+    """Stands in for BrowserPool without Chromium: renders by plain download"""
+
+    launches = 0
+
+    def __init__(self, size=None):
+        self.size = size
+        self.closed = False
+
+    async def __aenter__(self):
+        FakeBrowserPool.launches += 1
+        return self
+
+    async def close(self):
+        self.closed = True
+
+    async def render(self, url, wait_for=None):
+        with urllib.request.urlopen(url) as response:
+            return response.read().decode()
+
+def test_render_path_keeps_one_pool(server, monkeypatch):
+    monkeypatch.setattr(html, 'BrowserPool', FakeBrowserPool)
+    FakeBrowserPool.launches = 0
+
+    fetcher = make_fetcher(server, requires_js=True)
+    try:
+        assert external_ids(fetcher.fetch_jobs('python', page=1)) == ['acme-101', 'acme-102']
+        pool = fetcher._pool
+        assert external_ids(fetcher.fetch_jobs('python', page=2)) == ['acme-201']
+        assert len(fetcher.fetch_all_pages('python')) == 3
+
+        # Calls from another thread go to the same loop and pool
+        results = []
+        thread = threading.Thread(target=lambda: results.append(fetcher.fetch_jobs('python', page=2)))
+        thread.start()
+        thread.join()
+        assert external_ids(results[0]) == ['acme-201']
+
+        assert fetcher._pool is pool
+        assert FakeBrowserPool.launches == 1
+    finally:
+        fetcher.close()
+
+    assert pool.closed
+    assert fetcher._loop is None
+
+@pytest.fixture
+def browser_fetcher(server):
+    """A requires_js fetcher with a running Chromium, or skip"""
+    pytest.importorskip('playwright')
+    fetcher = make_fetcher(server, page_name='careers_js_{page}.html', pages=1,
+                           requires_js=True, wait_for='li.opening', concurrency=2)
+    try:
+        fetcher._run(fetcher._get_pool())
+    except Exception as e:
+        fetcher.close()
+        pytest.skip(f"Playwright Chromium not available: {str(e).splitlines()[0]}")
+    yield fetcher
+    fetcher.close()
+
+def test_render_with_browser(server, browser_fetcher):
+    pool = browser_fetcher._pool
+
+    # Listings on this page only exist after its script runs
+    jobs = browser_fetcher.fetch_jobs('python')
+    assert external_ids(jobs) == ['acme-js-1', 'acme-js-2']
+    assert jobs[0]['url'] == f"{server}/careers/jobs/js-1"
+    assert jobs[1]['url'] == f"{server}/jobs/js-2"
+
+    # Static pages render to the same jobs as the plain HTTP path
+    browser_fetcher.url_template = server + '/careers_{page}.html?q={keyword}&where={location}'
+    browser_fetcher.pages = 2
+    browser_fetcher.wait_for = None
+    assert external_ids(browser_fetcher.fetch_all_pages('python')) == ['acme-101', 'acme-102', 'acme-201']
+
+    assert browser_fetcher._pool is pool
+    assert pool.aborted['image'] >= 2
+    assert pool.aborted['script'] >= 2